@@ -36,5 +36,14 @@ class Settings(BaseSettings):
     task_queue_retry_delay_seconds: int = 60
     task_queue_job_timeout_seconds: int = 600  # 10 minutes for Claude API calls
 
+    # Claude generation result cache (per worker process)
+    claude_cache_ttl_seconds: int = 3600
+    claude_cache_max_entries: int = 256
+    # Max Claude CLI processes running at once; further generations wait
+    claude_max_concurrent: int = 4
+
+    # Prebuilt OpenAPI document (see app.generate_openapi); generated at runtime if unset
+    openapi_schema_path: Path | None = None
+
 
 settings = Settings()
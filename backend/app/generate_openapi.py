@@ -0,0 +1,32 @@
+"""Write the OpenAPI document for the ATC API.
+
+Usage:
+    python -m app.generate_openapi openapi.json
+
+Point OPENAPI_SCHEMA_PATH at the resulting file to have the app serve it
+from /openapi.json instead of generating the schema at runtime. The schema
+is always generated from the current routes, even if OPENAPI_SCHEMA_PATH is
+set while this runs.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+from app.main import app
+
+
+def main() -> None:
+    if len(sys.argv) != 2:
+        sys.exit("usage: python -m app.generate_openapi <output-path>")
+
+    output_path = Path(sys.argv[1])
+    # Drop any schema app.main loaded from OPENAPI_SCHEMA_PATH so a rebuild
+    # never re-emits a stale document
+    app.openapi_schema = None
+    output_path.write_text(json.dumps(app.openapi(), indent=2))
+    print(f"Wrote OpenAPI schema to {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import json
 import logging
 import sys
 import traceback
@@ -85,6 +86,10 @@ async def lifespan(app: FastAPI):
     # Run database migrations first
     run_migrations()
 
+    # Build (or reuse the prebuilt) OpenAPI schema now, so the first
+    # /openapi.json request doesn't walk every route and nested model.
+    app.openapi()
+
     logger.info("Initializing Redis connection pool...")
     await get_redis_pool()
     logger.info("Redis connection pool initialized")
@@ -180,6 +185,11 @@ ROUTERS = [
 for router, tag in ROUTERS:
     app.include_router(router, prefix="/api/v1", tags=[tag])
 
+if settings.openapi_schema_path:
+    # Serve the schema generated at build time instead of walking every route
+    # and model on the first /openapi.json request.
+    app.openapi_schema = json.loads(settings.openapi_schema_path.read_text())
+
 
 @app.get("/health", tags=["Health"], include_in_schema=True)
 async def health_check():
@@ -11,6 +11,7 @@ from datetime import datetime, timezone
 from typing import AsyncIterator
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, status
 from sqlalchemy import select
 from sqlalchemy.orm import Session
@@ -283,7 +284,9 @@ async def debug_claude_console(websocket: WebSocket):
                                 session_id = message["session_id"]
                                 logger.info(f"Captured session_id for user {current_user.id}: {session_id}")
 
-                            await websocket.send_json(message)
+                            # Hot path: frames are plain dicts, so encode with orjson
+                            # directly rather than through stdlib json.
+                            await websocket.send_text(orjson.dumps(message).decode())
 
                         success = True
                         logger.info(f"Claude stream completed successfully for user {current_user.id}")
@@ -25,8 +25,8 @@ from app.schemas import (
     SpawnTasksResponse,
     SpawnTasksStatus,
 )
-from app.schemas.plan import ReviewSummary, TaskSummary, ThreadSummary
 from app.schemas.review import ReviewTargetType
+from app.schemas.task import ReviewSummary, TaskSummary, ThreadSummary
 from app.services.claude import claude_service
 from app.services.task_queue import (
     is_job_running,
@@ -93,7 +93,7 @@ async def get_plan(plan_id: UUID, db: Session = Depends(get_db)):
     plan = get_or_404(db, PlanModel, plan_id)
 
     tasks = [
-        TaskSummary(id=task.id, title=task.title, status=task.status)
+        TaskSummary(id=task.id, title=task.title, status=PlanTaskStatus(task.status.value))
         for task in plan.tasks
     ]
 
@@ -101,7 +101,7 @@ async def get_plan(plan_id: UUID, db: Session = Depends(get_db)):
         ReviewSummary(
             id=review.id,
             reviewer_id=review.reviewer_id,
-            decision=review.decision,
+            decision=review.decision.value,
             created_at=review.created_at,
         )
         for review in plan.reviews
@@ -158,7 +158,7 @@ async def delete_plan(plan_id: UUID, db: Session = Depends(get_db)):
 async def list_plan_tasks(plan_id: UUID, db: Session = Depends(get_db)):
     plan = get_or_404(db, PlanModel, plan_id)
     return [
-        TaskSummary(id=task.id, title=task.title, status=task.status)
+        TaskSummary(id=task.id, title=task.title, status=PlanTaskStatus(task.status.value))
         for task in plan.tasks
     ]
 
@@ -488,7 +488,7 @@ async def get_spawned_tasks(
             id=task.id,
             title=task.title,
             description=task.description,
-            blocked_by=[t.id for t in task.blocked_by],
+            blocked_by=tuple(t.id for t in task.blocked_by),
         )
         for task in plan.tasks
     ]
@@ -18,7 +18,7 @@ from app.schemas import (
     StandardError,
 )
 from app.schemas.session import SessionTargetType
-from app.schemas.websocket import StatusMessage
+from app.schemas.websocket import StatusMessage, WSServerMessageAdapter
 
 router = APIRouter()
 
@@ -142,10 +142,10 @@ async def session_stream(websocket: WebSocket, session_id: UUID):
         await websocket.accept()
 
         # Send initial status message
-        await websocket.send_json(
-            StatusMessage(status=session.status, timestamp=datetime.now(timezone.utc)).model_dump(
-                mode="json"
-            )
+        await websocket.send_text(
+            WSServerMessageAdapter.dump_json(
+                StatusMessage(status=session.status, timestamp=datetime.now(timezone.utc))
+            ).decode()
         )
 
         try:
@@ -168,11 +168,13 @@ async def session_stream(websocket: WebSocket, session_id: UUID):
 
                     db.commit()
 
-                    await websocket.send_json(
-                        StatusMessage(
-                            status=CodingSessionStatus.ABORTED.value,
-                            timestamp=datetime.now(timezone.utc),
-                        ).model_dump(mode="json")
+                    await websocket.send_text(
+                        WSServerMessageAdapter.dump_json(
+                            StatusMessage(
+                                status=CodingSessionStatus.ABORTED.value,
+                                timestamp=datetime.now(timezone.utc),
+                            )
+                        ).decode()
                     )
                     break
         except WebSocketDisconnect:
@@ -1,8 +1,13 @@
+import asyncio
 from collections import deque
+from collections.abc import Iterator, Sequence
 from datetime import datetime, timezone
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.config import settings
@@ -24,19 +29,21 @@ from app.schemas import (
     Task,
     TaskCreate,
     TaskImage,
+    TaskImageSummary,
     TaskUpdate,
     TaskWithDetails,
 )
 from app.schemas.common import PlanTaskStatus as SchemaPlanTaskStatus
 from app.schemas.task import (
     BlockingTasksUpdate,
-    ImageSummary,
     PlanSummary,
     ReviewSummary,
     SessionSummary,
+    TaskListAdapter,
     TaskSummary,
     ThreadSummary,
 )
+from app.schemas.task_image import TaskImageListAdapter
 from app.services.git import (
     BranchExistsError,
     GitError,
@@ -54,7 +61,7 @@ router = APIRouter()
 
 def _detect_cycle(
     task_id: UUID,
-    new_blocked_by: list[UUID],
+    new_blocked_by: Sequence[UUID],
     session: Session,
 ) -> bool:
     """
@@ -92,16 +99,24 @@ def _detect_cycle(
 
 
 def _validate_blocking_tasks(
-    blocking_ids: list[UUID],
+    blocking_ids: Sequence[UUID],
     project_id: UUID,
     db: Session,
 ) -> list[TaskModel]:
     """Validate that all blocking tasks exist and belong to the same project."""
+    if not blocking_ids:
+        return []
+
+    # Load every blocker in one query instead of one round-trip per ID
+    found = {
+        t.id: t for t in db.scalars(select(TaskModel).where(TaskModel.id.in_(blocking_ids)))
+    }
+
     blocking_tasks: list[TaskModel] = []
     for blocking_id in blocking_ids:
-        blocking_task = get_or_404(
-            db, TaskModel, blocking_id, detail=f"Blocking task {blocking_id} not found"
-        )
+        blocking_task = found.get(blocking_id)
+        if blocking_task is None:
+            raise HTTPException(status_code=404, detail=f"Blocking task {blocking_id} not found")
         if blocking_task.project_id != project_id:
             raise HTTPException(
                 status_code=400,
@@ -282,7 +297,7 @@ async def list_project_tasks(
     pages = (total + limit - 1) // limit if total > 0 else 0
 
     return PaginatedResponse[Task](
-        items=[Task.model_validate(t) for t in items],
+        items=TaskListAdapter.validate_python(items, from_attributes=True),
         total=total,
         page=page,
         limit=limit,
@@ -350,7 +365,7 @@ async def get_task(task_id: UUID, db: Session = Depends(get_db)):
         title=task.title,
         description=task.description,
         status=SchemaPlanTaskStatus(task.status.value),
-        blocked_by=[t.id for t in task.blocked_by],
+        blocked_by=tuple(t.id for t in task.blocked_by),
         branch_name=task.branch_name,
         worktree_path=task.worktree_path,
         version=task.version,
@@ -361,7 +376,15 @@ async def get_task(task_id: UUID, db: Session = Depends(get_db)):
         reviews=_build_reviews_summaries(task),
         threads=_build_threads_summaries(task),
         active_session=_build_active_session(task),
-        images=[ImageSummary.model_validate(img) for img in task.images],
+        images=[
+            TaskImageSummary(
+                id=img.id,
+                original_filename=img.original_filename,
+                content_type=img.content_type,
+                size_bytes=img.size_bytes,
+            )
+            for img in task.images
+        ],
     )
 
 
@@ -708,7 +731,10 @@ async def end_session(
     git_service = GitService(settings.worktrees_base_path)
 
     try:
-        git_service.cleanup_task_worktree(
+        # Worktree removal shells out to git and deletes a directory tree;
+        # keep that off the event loop.
+        await asyncio.to_thread(
+            git_service.cleanup_task_worktree,
             project_id=project.id,
             task_id=task.id,
             branch_name=task.branch_name,
@@ -744,8 +770,16 @@ async def get_task_diff(
     ),
     db: Session = Depends(get_db),
 ):
-    from app.schemas.task import DiffLine, DiffLineType
-    from app.services.git import GitError, generate_diff, parse_patch_lines
+    """Stream the task's CodeDiff as JSON.
+
+    The per-file diffs are collected before the response starts. git only
+    reports failure through its exit status once all of its output has been
+    read, and a GitError raised mid-stream could no longer turn the 200
+    already sent into a 500. Only the JSON encoding, including the optional
+    line-level parsing, is streamed.
+    """
+    from app.schemas.task import DiffLineListAdapter, FileDiffAdapter
+    from app.services.git import GitError, iter_file_diffs, parse_patch_lines
 
     task = get_or_404(db, TaskModel, task_id)
 
@@ -764,58 +798,53 @@ async def get_task_diff(
 
     # Get the base branch from the project
     base_branch = task.project.main_branch
+    head_branch = task.branch_name
 
+    # Materialized up front so git errors map to a 500 (see docstring)
     try:
-        diff_result = generate_diff(
-            repo_path=task.worktree_path,
-            base_branch=base_branch,
-            head_branch=task.branch_name,
+        file_diffs = list(
+            iter_file_diffs(
+                repo_path=task.worktree_path,
+                base_branch=base_branch,
+                head_branch=head_branch,
+            )
         )
     except GitError as e:
         raise HTTPException(status_code=500, detail=f"Git error: {e}")
 
-    # Build file diffs with optional line-level information
-    from app.schemas.task import FileDiff as FileDiffSchema
-
-    files = []
-    total_additions = 0
-    total_deletions = 0
-
-    for file_diff in diff_result.files:
-        total_additions += file_diff.additions
-        total_deletions += file_diff.deletions
-
-        lines = None
-        if include_lines and file_diff.patch:
-            parsed_lines = parse_patch_lines(file_diff.patch)
-            lines = [
-                DiffLine(
-                    type=DiffLineType(line.type),
-                    content=line.content,
-                    old_line_number=line.old_line_number,
-                    new_line_number=line.new_line_number,
-                )
-                for line in parsed_lines
-            ]
-
-        files.append(
-            FileDiffSchema(
-                path=file_diff.path,
-                status=file_diff.status,
-                additions=file_diff.additions,
-                deletions=file_diff.deletions,
-                patch=file_diff.patch,
-                lines=lines,
-            )
+    def stream_code_diff() -> Iterator[bytes]:
+        """Write the CodeDiff JSON one file at a time.
+
+        Totals are only known once every file has been seen, so they are
+        emitted after the files array.
+        """
+        total_additions = 0
+        total_deletions = 0
+
+        yield b'{"base_branch":%b,"head_branch":%b,"files":[' % (
+            orjson.dumps(base_branch),
+            orjson.dumps(head_branch),
         )
+        for i, file_diff in enumerate(file_diffs):
+            total_additions += file_diff.additions
+            total_deletions += file_diff.deletions
+
+            if include_lines and file_diff.patch:
+                # Validate the whole parsed patch in a single adapter call
+                lines = DiffLineListAdapter.validate_python(
+                    parse_patch_lines(file_diff.patch), from_attributes=True
+                )
+                file_diff = file_diff.model_copy(update={"lines": lines})
 
-    return CodeDiff(
-        base_branch=diff_result.base_branch,
-        head_branch=diff_result.head_branch,
-        files=files,
-        total_additions=total_additions,
-        total_deletions=total_deletions,
-    )
+            if i:
+                yield b","
+            # None values (unrequested `lines`, missing line numbers on
+            # added/deleted lines) are omitted; clients treat a missing key
+            # the same as null.
+            yield FileDiffAdapter.dump_json(file_diff, exclude_none=True)
+        yield b'],"total_additions":%d,"total_deletions":%d}' % (total_additions, total_deletions)
+
+    return StreamingResponse(stream_code_diff(), media_type="application/json")
 
 
 # =============================================================================
@@ -835,7 +864,7 @@ async def get_task_diff(
 )
 async def list_task_images(task_id: UUID, db: Session = Depends(get_db)):
     task = get_or_404(db, TaskModel, task_id)
-    return [TaskImage.model_validate(img) for img in task.images]
+    return TaskImageListAdapter.validate_python(task.images, from_attributes=True)
 
 
 @router.post(
@@ -18,7 +18,7 @@ from app.schemas import (
     TriageItem,
     TriageItemStatus,
 )
-from app.schemas.triage import TriageItemPlan, TriageItemReject
+from app.schemas.triage import TriageItemListAdapter, TriageItemPlan, TriageItemReject
 
 router = APIRouter()
 
@@ -129,7 +129,7 @@ async def list_connection_items(
     pages = (total + limit - 1) // limit if total > 0 else 0
 
     return PaginatedResponse[TriageItem](
-        items=paginated_items,
+        items=TriageItemListAdapter.validate_python(paginated_items, from_attributes=True),
         total=total,
         page=page,
         limit=limit,
@@ -10,3 +10,12 @@ class PlanTaskStatus(str, Enum):
     CICD = "cicd"
     MERGED = "merged"
     CLOSED = "closed"
+
+
+def validate_http_url(v: str | None) -> str | None:
+    """Cheap scheme check for URLs that come from trusted storage or APIs."""
+    if v is None:
+        return v
+    if not v.startswith(("http://", "https://")):
+        raise ValueError("URL must start with http:// or https://")
+    return v
@@ -1,10 +1,13 @@
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Annotated
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
 from app.models.enums import ProcessingStatus
 from app.schemas.common import PlanTaskStatus
+from app.schemas.task import ReviewSummary, TaskSummary, ThreadSummary
 
 
 class PlanBase(BaseModel):
@@ -12,6 +15,17 @@ class PlanBase(BaseModel):
     content: str | None = Field(default=None, description="Markdown content describing the plan")
 
 
+class ProcessingMixin(BaseModel):
+    """Fields tracking background AI processing of a plan."""
+
+    processing_status: ProcessingStatus | None = Field(
+        default=None, description="Status of AI content generation"
+    )
+    processing_error: str | None = Field(
+        default=None, description="Error message if generation failed"
+    )
+
+
 class PlanCreate(PlanBase):
     parent_task_id: UUID | None = Field(
         default=None, description="Task ID if this plan was spawned by a complex task"
@@ -23,7 +37,7 @@ class PlanUpdate(BaseModel):
     content: str | None = Field(default=None, description="Markdown content")
 
 
-class Plan(PlanBase):
+class Plan(PlanBase, ProcessingMixin):
     id: UUID = Field(description="Plan unique identifier")
     project_id: UUID = Field(description="Parent project ID")
     status: PlanTaskStatus = Field(description="Current plan status")
@@ -31,12 +45,6 @@ class Plan(PlanBase):
         default=None, description="Task ID if this plan was spawned by a complex task"
     )
     version: int = Field(default=1, description="Plan version number")
-    processing_status: ProcessingStatus | None = Field(
-        default=None, description="Status of AI content generation"
-    )
-    processing_error: str | None = Field(
-        default=None, description="Error message if generation failed"
-    )
     created_by: UUID | None = Field(default=None, description="User or system that created")
     created_at: datetime = Field(description="Creation timestamp")
     updated_at: datetime | None = Field(default=None, description="Last update timestamp")
@@ -45,32 +53,13 @@ class Plan(PlanBase):
 
 
 class PlanWithDetails(Plan):
-    tasks: list["TaskSummary"] = Field(default_factory=list, description="Tasks spawned by plan")
-    reviews: list["ReviewSummary"] = Field(default_factory=list, description="Reviews on this plan")
-    threads: list["ThreadSummary"] = Field(
+    tasks: list[TaskSummary] = Field(default_factory=list, description="Tasks spawned by plan")
+    reviews: list[ReviewSummary] = Field(default_factory=list, description="Reviews on this plan")
+    threads: list[ThreadSummary] = Field(
         default_factory=list, description="Comment threads on this plan"
     )
 
 
-class TaskSummary(BaseModel):
-    id: UUID
-    title: str
-    status: PlanTaskStatus
-
-
-class ReviewSummary(BaseModel):
-    id: UUID
-    reviewer_id: UUID
-    decision: str
-    created_at: datetime
-
-
-class ThreadSummary(BaseModel):
-    id: UUID
-    status: str
-    comment_count: int
-
-
 class PlanGenerateRequest(BaseModel):
     """Request to generate plan content using Claude."""
 
@@ -101,15 +90,16 @@ class SpawnTasksRequest(BaseModel):
     pass  # No additional parameters needed; plan content is used
 
 
-class SpawnedTaskSummary(BaseModel):
+@dataclass(slots=True, frozen=True)
+class SpawnedTaskSummary:
     """Summary of a task spawned from a plan."""
 
-    id: UUID = Field(description="Task ID")
-    title: str = Field(description="Task title")
-    description: str | None = Field(default=None, description="Task description")
-    blocked_by: list[UUID] = Field(
-        default_factory=list, description="IDs of tasks that block this task"
-    )
+    id: Annotated[UUID, Field(description="Task ID")]
+    title: Annotated[str, Field(description="Task title")]
+    description: Annotated[str | None, Field(description="Task description")] = None
+    blocked_by: Annotated[
+        tuple[UUID, ...], Field(description="IDs of tasks that block this task")
+    ] = ()
 
 
 class SpawnTasksResponse(BaseModel):
@@ -133,6 +123,3 @@ class SpawnTasksStatus(BaseModel):
     tasks_created: int | None = Field(
         default=None, description="Number of tasks created (if completed)"
     )
-
-
-PlanWithDetails.model_rebuild()
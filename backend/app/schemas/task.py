@@ -1,11 +1,13 @@
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, TypeAdapter, model_validator
 
 from app.schemas.common import PlanTaskStatus
+from app.schemas.task_image import TaskImageSummary
 
 
 class FileStatus(str, Enum):
@@ -58,8 +60,8 @@ class TaskBase(BaseModel):
 
 class TaskCreate(TaskBase):
     plan_id: UUID | None = Field(default=None, description="Parent plan that spawned this task")
-    blocked_by: list[UUID] = Field(
-        default_factory=list, description="Task IDs that must complete first (DAG)"
+    blocked_by: tuple[UUID, ...] = Field(
+        default_factory=tuple, description="Task IDs that must complete first (DAG)"
     )
 
 
@@ -69,7 +71,7 @@ class TaskUpdate(BaseModel):
 
 
 class BlockingTasksUpdate(BaseModel):
-    blocked_by: list[UUID] = Field(
+    blocked_by: tuple[UUID, ...] = Field(
         description="Task IDs that must complete before this task can start"
     )
 
@@ -79,8 +81,8 @@ class Task(TaskBase):
     project_id: UUID = Field(description="Parent project ID")
     plan_id: UUID | None = Field(default=None, description="Parent plan that spawned this task")
     status: PlanTaskStatus = Field(description="Current task status")
-    blocked_by: list[UUID] = Field(
-        default_factory=list, description="Task IDs that must complete first"
+    blocked_by: tuple[UUID, ...] = Field(
+        default_factory=tuple, description="Task IDs that must complete first"
     )
     branch_name: str | None = Field(
         default=None, description="Git branch name (created when task enters Coding)"
@@ -92,15 +94,15 @@ class Task(TaskBase):
     created_at: datetime = Field(description="Creation timestamp")
     updated_at: datetime | None = Field(default=None, description="Last update timestamp")
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
     @model_validator(mode="before")
     @classmethod
     def convert_model_fields(cls, data: Any) -> Any:
         """Convert ORM model fields to schema-compatible format."""
         if hasattr(data, "__table__"):
-            # Convert blocked_by relationship to list of UUIDs
-            blocked_by_ids = [t.id for t in data.blocked_by] if data.blocked_by else []
+            # Convert blocked_by relationship to a tuple of UUIDs
+            blocked_by_ids = tuple(t.id for t in data.blocked_by)
             # Convert status enum
             status_value = data.status.value if hasattr(data.status, "value") else data.status
             return {
@@ -120,65 +122,59 @@ class Task(TaskBase):
         return data
 
 
-class ImageSummary(BaseModel):
-    """Summary of a task image for inclusion in task responses."""
-
-    id: UUID
-    original_filename: str
-    content_type: str
-    size_bytes: int
-
-    model_config = {"from_attributes": True}
-
-
-class TaskWithDetails(Task):
-    plan: "PlanSummary | None" = Field(default=None, description="Parent plan summary")
-    blocking_tasks: list["TaskSummary"] = Field(
-        default_factory=list, description="Tasks that block this task"
-    )
-    reviews: list["ReviewSummary"] = Field(default_factory=list, description="Reviews on this task")
-    threads: list["ThreadSummary"] = Field(
-        default_factory=list, description="Comment threads on this task"
-    )
-    active_session: "SessionSummary | None" = Field(
-        default=None, description="Currently active coding session"
-    )
-    images: list[ImageSummary] = Field(
-        default_factory=list, description="Images attached to this task"
-    )
-
-
-class PlanSummary(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PlanSummary:
     id: UUID
     title: str
     status: PlanTaskStatus
 
 
-class TaskSummary(BaseModel):
+@dataclass(slots=True, frozen=True)
+class TaskSummary:
     id: UUID
     title: str
     status: PlanTaskStatus
 
 
-class ReviewSummary(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ReviewSummary:
     id: UUID
     reviewer_id: UUID
     decision: str
     created_at: datetime
 
 
-class ThreadSummary(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ThreadSummary:
     id: UUID
     status: str
     comment_count: int
 
 
-class SessionSummary(BaseModel):
+@dataclass(slots=True, frozen=True)
+class SessionSummary:
     id: UUID
     status: str
     started_at: datetime
 
 
+class TaskWithDetails(Task):
+    plan: PlanSummary | None = Field(default=None, description="Parent plan summary")
+    blocking_tasks: list[TaskSummary] = Field(
+        default_factory=list, description="Tasks that block this task"
+    )
+    reviews: list[ReviewSummary] = Field(default_factory=list, description="Reviews on this task")
+    threads: list[ThreadSummary] = Field(
+        default_factory=list, description="Comment threads on this task"
+    )
+    active_session: SessionSummary | None = Field(
+        default=None, description="Currently active coding session"
+    )
+    images: list[TaskImageSummary] = Field(
+        default_factory=list, description="Images attached to this task"
+    )
+
+
 class StartSessionResponse(BaseModel):
     task_id: UUID = Field(description="Task ID")
     branch_name: str = Field(description="Git branch name created for this task")
@@ -187,4 +183,7 @@ class StartSessionResponse(BaseModel):
     session_started_at: datetime = Field(description="Timestamp when session started")
 
 
-TaskWithDetails.model_rebuild()
+# Reusable list adapters, built once at import time.
+DiffLineListAdapter = TypeAdapter(list[DiffLine])
+FileDiffAdapter = TypeAdapter(FileDiff)
+TaskListAdapter = TypeAdapter(list[Task])
@@ -1,7 +1,8 @@
+from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class TaskImageBase(BaseModel):
@@ -20,10 +21,11 @@ class TaskImage(TaskImageBase):
     task_id: UUID = Field(description="Parent task ID")
     created_at: datetime = Field(description="Upload timestamp")
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
 
-class TaskImageSummary(BaseModel):
+@dataclass(slots=True, frozen=True)
+class TaskImageSummary:
     """Summary of a task image for inclusion in task responses."""
 
     id: UUID
@@ -31,4 +33,5 @@ class TaskImageSummary(BaseModel):
     content_type: str
     size_bytes: int
 
-    model_config = {"from_attributes": True}
+
+TaskImageListAdapter = TypeAdapter(list[TaskImage])
@@ -2,7 +2,9 @@ from datetime import datetime
 from enum import Enum
 from uuid import UUID
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+
+from app.schemas.common import validate_http_url
 
 
 class TriageProvider(str, Enum):
@@ -46,13 +48,18 @@ class TriageItem(BaseModel):
     connection_id: UUID = Field(description="Parent connection ID")
     external_id: str = Field(description="ID in external system")
     title: str = Field(description="Issue title")
-    external_url: HttpUrl | None = Field(default=None, description="URL in external system")
+    external_url: str | None = Field(default=None, description="URL in external system")
     description: str | None = Field(default=None, description="Issue description")
     plan_id: UUID | None = Field(default=None, description="Plan ID if planned")
     status: TriageItemStatus = Field(default=TriageItemStatus.PENDING, description="Item status")
     imported_at: datetime = Field(description="Import timestamp")
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
+
+    @field_validator("external_url")
+    @classmethod
+    def validate_external_url(cls, v: str | None) -> str | None:
+        return validate_http_url(v)
 
 
 class TriageItemPlan(BaseModel):
@@ -61,3 +68,6 @@ class TriageItemPlan(BaseModel):
 
 class TriageItemReject(BaseModel):
     reason: str | None = Field(default=None, description="Rejection reason")
+
+
+TriageItemListAdapter = TypeAdapter(list[TriageItem])
@@ -1,14 +1,21 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field, HttpUrl
+from pydantic import BaseModel, EmailStr, Field, field_validator
+
+from app.schemas.common import validate_http_url
 
 
 class UserBase(BaseModel):
     git_handle: str = Field(description="GitHub/GitLab username")
     email: EmailStr = Field(description="User email address")
     display_name: str | None = Field(default=None, description="Display name")
-    avatar_url: HttpUrl | None = Field(default=None, description="Avatar URL")
+    avatar_url: str | None = Field(default=None, description="Avatar URL")
+
+    @field_validator("avatar_url")
+    @classmethod
+    def validate_avatar_url(cls, v: str | None) -> str | None:
+        return validate_http_url(v)
 
 
 class UserCreate(UserBase):
@@ -19,4 +26,4 @@ class User(UserBase):
     id: UUID = Field(description="User unique identifier")
     created_at: datetime = Field(description="Creation timestamp")
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
@@ -1,8 +1,8 @@
 from datetime import datetime
 from enum import Enum
-from typing import Literal, Union
+from typing import Annotated, Literal, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SkipValidation, TypeAdapter
 
 
 class WSServerMessageType(str, Enum):
@@ -18,7 +18,9 @@ class WSClientMessageType(str, Enum):
 class OutputMessage(BaseModel):
     type: Literal["output"] = "output"
     content: str = Field(description="Output text content")
-    timestamp: datetime = Field(description="Message timestamp")
+    # Preformatted by the sender so high-rate output frames skip datetime
+    # validation and formatting
+    timestamp: str = Field(description="ISO-8601 message timestamp")
 
 
 class StatusMessage(BaseModel):
@@ -30,7 +32,8 @@ class StatusMessage(BaseModel):
 class ToolUseMessage(BaseModel):
     type: Literal["tool_use"] = "tool_use"
     tool: str = Field(description="Tool name")
-    input: dict = Field(description="Tool input parameters")
+    # Tool inputs come straight from the agent runtime as a dict; don't re-walk them
+    input: SkipValidation[dict] = Field(description="Tool input parameters")
     timestamp: datetime = Field(description="Message timestamp")
 
 
@@ -38,5 +41,11 @@ class AbortMessage(BaseModel):
     type: Literal["abort"] = "abort"
 
 
-WSServerMessage = Union[OutputMessage, StatusMessage, ToolUseMessage]
+# Tagged on `type` so validation dispatches straight to the matching variant
+WSServerMessage = Annotated[
+    Union[OutputMessage, StatusMessage, ToolUseMessage],
+    Field(discriminator="type"),
+]
 WSClientMessage = AbortMessage
+
+WSServerMessageAdapter = TypeAdapter(WSServerMessage)
@@ -7,11 +7,22 @@ It does NOT make direct HTTP calls to the Anthropic API. All communication goes
 the Claude Code CLI which handles API interactions internally using user subscription tokens.
 """
 
-import json
+import asyncio
+import hashlib
+import io
 import logging
+import re
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import aclosing, asynccontextmanager
 from dataclasses import dataclass, field
+from types import ModuleType
+from typing import Any, Generic, TypeVar
 from uuid import UUID
 
+from pydantic import BaseModel, Field, StrictStr, ValidationError, field_validator
+
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -35,7 +46,7 @@ class ClaudeGenerationError(ClaudeServiceError):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationResult:
     """Result of a plan generation request."""
 
@@ -44,7 +55,7 @@ class GenerationResult:
     duration_ms: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratedTask:
     """A task generated from a plan."""
 
@@ -53,7 +64,7 @@ class GeneratedTask:
     blocked_by_indices: list[int] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskGenerationResult:
     """Result of task generation from a plan."""
 
@@ -62,8 +73,160 @@ class TaskGenerationResult:
     duration_ms: int | None = None
 
 
-# Default prompt template for plan generation
-PLAN_GENERATION_PROMPT = """You are a software architect helping to create a detailed implementation plan.
+T = TypeVar("T")
+
+
+class _GenerationCache(Generic[T]):
+    """In-process TTL cache for generation results, keyed by the prompt inputs.
+
+    Lets a retried job with identical inputs reuse the result an earlier
+    attempt already paid for instead of calling Claude again.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, T]] = OrderedDict()
+
+    @staticmethod
+    def make_key(*parts: str | None) -> str:
+        return hashlib.sha256("\0".join(p or "" for p in parts).encode()).hexdigest()
+
+    def get(self, key: str) -> T | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: T) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_plan_cache: _GenerationCache[GenerationResult] = _GenerationCache(
+    settings.claude_cache_ttl_seconds, settings.claude_cache_max_entries
+)
+
+# Generations currently running, keyed like the cache above
+_inflight: dict[str, asyncio.Future] = {}
+
+
+class _OwnerGone(Exception):
+    """The caller running a shared generation stopped before finishing it."""
+
+
+async def _coalesce(key: str, run: Callable[[], Awaitable[T]]) -> T:
+    """Run `run()` once per key; concurrent callers with the same key share its outcome.
+
+    If the caller running the work is cancelled, its waiters are not: the
+    first of them to resume runs the work itself and the rest join it.
+    """
+    while (pending := _inflight.get(key)) is not None:
+        logger.info("Joining in-flight generation for identical request")
+        try:
+            return await asyncio.shield(pending)
+        except _OwnerGone:
+            continue
+
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        result = await run()
+    except Exception as e:
+        future.set_exception(e)
+        # Mark as retrieved so an unshared failure isn't logged a second time
+        future.exception()
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        _inflight.pop(key, None)
+        if not future.done():
+            # Cancelled or interrupted: hand the work back to the waiters
+            # instead of propagating our cancellation to them
+            future.set_exception(_OwnerGone())
+            future.exception()
+
+
+# claude_agent_sdk module, imported on first use so the app starts without it
+_sdk: ModuleType | None = None
+_sdk_error: ImportError | None = None
+
+
+def _load_sdk() -> ModuleType:
+    """Import claude_agent_sdk once and return the cached module.
+
+    Raises:
+        ClaudeNotConfiguredError: If the SDK is not installed
+    """
+    global _sdk, _sdk_error
+    if _sdk is None and _sdk_error is None:
+        try:
+            import claude_agent_sdk
+        except ImportError as e:
+            logger.error(f"Claude Agent SDK not installed: {e!r}", exc_info=True)
+            _sdk_error = e
+        else:
+            _sdk = claude_agent_sdk
+    if _sdk is None:
+        raise ClaudeNotConfiguredError(
+            "Claude Agent SDK not installed. Run: pip install claude-agent-sdk"
+        ) from _sdk_error
+    return _sdk
+
+
+# Bounds concurrent Claude CLI processes; callers beyond the limit queue here
+_sdk_semaphore = asyncio.Semaphore(settings.claude_max_concurrent)
+_sdk_waiting = 0
+
+
+@asynccontextmanager
+async def _sdk_slot() -> AsyncIterator[None]:
+    """Hold one of the limited Claude SDK slots for the duration of a query."""
+    global _sdk_waiting
+    _sdk_waiting += 1
+    if _sdk_semaphore.locked():
+        logger.info(f"All Claude SDK slots busy; {_sdk_waiting} generation(s) waiting")
+    try:
+        await _sdk_semaphore.acquire()
+    finally:
+        _sdk_waiting -= 1
+    try:
+        yield
+    finally:
+        _sdk_semaphore.release()
+
+
+def _log_prompt_cache_usage(label: str, usage: dict[str, Any] | None) -> None:
+    """Log how much of a query's input was served from the prompt cache.
+
+    The Claude Code CLI marks the system prompt as cacheable itself, so this
+    only reports the outcome from the ResultMessage usage.
+    """
+    if not usage:
+        return
+    logger.info(
+        f"{label}: input_tokens={usage.get('input_tokens')}, "
+        f"cache_read_input_tokens={usage.get('cache_read_input_tokens')}, "
+        f"cache_creation_input_tokens={usage.get('cache_creation_input_tokens')}"
+    )
+
+
+# Static instructions for plan generation. Sent as the system prompt so every
+# request shares an identical, cacheable prefix; only the user prompt varies.
+PLAN_GENERATION_SYSTEM_PROMPT = """\
+You are a software architect helping to create a detailed implementation plan.
 
 Given the following plan title and any additional context, generate a comprehensive markdown document that includes:
 
@@ -75,23 +238,34 @@ Given the following plan title and any additional context, generate a comprehens
 6. **Risks & Mitigations**: Potential challenges and how to address them
 7. **Success Criteria**: How we'll know the plan is complete
 
-Keep the plan practical, actionable, and appropriate for a development team to execute.
-
----
+Keep the plan practical, actionable, and appropriate for a development team to execute."""
 
-**Plan Title**: {title}
+# Per-request part of the plan generation prompt
+PLAN_GENERATION_PROMPT = """**Plan Title**: {title}
 
 {context_section}
 
 Generate the plan content in markdown format:"""
 
 
+def _build_plan_context_section(context: str | None, project_context: str | None) -> str:
+    """Format the optional project and user context for a plan prompt."""
+    context_parts = []
+    if project_context:
+        context_parts.append(f"**Project Context**:\n{project_context}")
+    if context:
+        context_parts.append(f"**Additional Context**:\n{context}")
+
+    return "\n\n".join(context_parts) if context_parts else ""
+
+
 async def generate_plan_content(
     plan_id: UUID,
     title: str,
     context: str | None = None,
     project_context: str | None = None,
     subscription_token: str | None = None,
+    use_cache: bool = False,
 ) -> GenerationResult:
     """Generate plan content using the Claude Agent SDK.
 
@@ -101,6 +275,8 @@ async def generate_plan_content(
         context: Additional context provided by the user
         project_context: Context about the project (e.g., repository info)
         subscription_token: Claude Code subscription token from pool rotation
+        use_cache: Return a recent result for the same plan and inputs instead of
+            calling Claude; results are stored either way
 
     Returns:
         GenerationResult with the generated content
@@ -111,77 +287,164 @@ async def generate_plan_content(
     """
     if not subscription_token:
         raise ClaudeNotConfiguredError(
-            "No Claude Code subscription token available. Users should add tokens via /claude-tokens API."
+            "No Claude Code subscription token available. "
+            "Users should add tokens via /claude-tokens API."
         )
 
-    # Build context section
-    context_parts = []
-    if project_context:
-        context_parts.append(f"**Project Context**:\n{project_context}")
-    if context:
-        context_parts.append(f"**Additional Context**:\n{context}")
+    cache_key = _GenerationCache.make_key("plan", str(plan_id), title, context, project_context)
+    if use_cache:
+        cached = _plan_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Plan generation cache hit for plan_id={plan_id}")
+            return cached
 
-    context_section = "\n\n".join(context_parts) if context_parts else ""
+    async def run() -> GenerationResult:
+        return await _generate_plan(plan_id, title, context, project_context, subscription_token)
 
-    prompt = PLAN_GENERATION_PROMPT.format(
+    # Identical requests already in flight share one Claude call
+    result = await _coalesce(cache_key, run)
+    _plan_cache.set(cache_key, result)
+    return result
+
+
+async def _generate_plan(
+    plan_id: UUID,
+    title: str,
+    context: str | None,
+    project_context: str | None,
+    subscription_token: str,
+) -> GenerationResult:
+    """Run a single plan generation and collect the streamed text."""
+    usage: dict[str, float | int | None] = {}
+
+    def record_usage(total_cost_usd: float | None, duration_ms: int | None) -> None:
+        usage["total_cost_usd"] = total_cost_usd
+        usage["duration_ms"] = duration_ms
+
+    buffer = io.StringIO()
+    separator = ""
+    stream = stream_plan_content(
+        plan_id=plan_id,
         title=title,
-        context_section=context_section,
+        context=context,
+        project_context=project_context,
+        subscription_token=subscription_token,
+        on_result=record_usage,
+    )
+    async with aclosing(stream):
+        async for text in stream:
+            buffer.write(separator)
+            buffer.write(text)
+            separator = "\n"
+    generated_content = buffer.getvalue()
+
+    if not generated_content:
+        logger.error(f"No content generated from Claude for plan_id={plan_id}")
+        raise ClaudeGenerationError("No content generated from Claude")
+
+    logger.info(
+        f"Plan generation completed for plan_id={plan_id}, "
+        f"content_length={len(generated_content)}, cost_usd={usage.get('total_cost_usd')}"
     )
 
-    try:
-        # Import here to avoid import errors if SDK not installed
-        from claude_agent_sdk import (
-            AssistantMessage,
-            ClaudeAgentOptions,
-            TextBlock,
-            query,
+    return GenerationResult(
+        content=generated_content,
+        total_cost_usd=usage.get("total_cost_usd"),
+        duration_ms=usage.get("duration_ms"),
+    )
+
+
+async def stream_plan_content(
+    plan_id: UUID,
+    title: str,
+    context: str | None = None,
+    project_context: str | None = None,
+    subscription_token: str | None = None,
+    on_result: Callable[[float | None, int | None], None] | None = None,
+) -> AsyncIterator[str]:
+    """Generate plan content, yielding each text block as Claude produces it.
+
+    Unlike generate_plan_content, this always calls Claude; results are
+    neither cached nor coalesced. The generator holds a Claude SDK slot
+    until it finishes, so callers that may stop early must close it (e.g.
+    with contextlib.aclosing) rather than leave it to garbage collection.
+
+    Args:
+        plan_id: UUID of the plan being generated
+        title: Title of the plan
+        context: Additional context provided by the user
+        project_context: Context about the project (e.g., repository info)
+        subscription_token: Claude Code subscription token from pool rotation
+        on_result: Called with the query's total cost (USD) and duration (ms)
+            once Claude reports them
+
+    Yields:
+        Markdown text blocks of the plan, in order
+
+    Raises:
+        ClaudeNotConfiguredError: If no subscription token provided
+        ClaudeGenerationError: If generation fails
+    """
+    if not subscription_token:
+        raise ClaudeNotConfiguredError(
+            "No Claude Code subscription token available. "
+            "Users should add tokens via /claude-tokens API."
         )
 
+    prompt = PLAN_GENERATION_PROMPT.format(
+        title=title,
+        context_section=_build_plan_context_section(context, project_context),
+    )
+
+    sdk = _load_sdk()
+    # Bind the message types locally for the per-message isinstance checks
+    AssistantMessage, ResultMessage, TextBlock = (
+        sdk.AssistantMessage,
+        sdk.ResultMessage,
+        sdk.TextBlock,
+    )
+
+    try:
         logger.info(f"Starting plan generation for plan_id={plan_id}, title='{title}'")
-        logger.debug(f"Prompt length: {len(prompt)} characters")
+        logger.debug("Prompt length: %d characters", len(prompt))
 
         # Configure options for plan generation
         # Pass subscription token to Claude Code CLI via environment variable
         # The CLI handles all API communication internally
-        options = ClaudeAgentOptions(
+        options = sdk.ClaudeAgentOptions(
+            system_prompt=PLAN_GENERATION_SYSTEM_PROMPT,
             max_turns=1,  # Single turn for plan generation
             env={"ANTHROPIC_API_KEY": subscription_token},
         )
 
-        # Use query() async iterator to collect responses
-        content_parts: list[str] = []
+        # Yield text blocks as the query() async iterator produces them
+        # Check the log level once so the per-message path skips formatting
+        debug = logger.isEnabledFor(logging.DEBUG)
         message_count = 0
-        async for message in query(prompt=prompt, options=options):
-            message_count += 1
-            logger.debug(f"Received message #{message_count} from Claude SDK")
-            if isinstance(message, AssistantMessage):
-                for block in message.content:
-                    if isinstance(block, TextBlock):
-                        content_parts.append(block.text)
-                        logger.debug(f"Added text block with {len(block.text)} characters")
-
-        generated_content = "\n".join(content_parts)
-
-        if not generated_content:
-            logger.error(f"No content generated from Claude for plan_id={plan_id}")
-            raise ClaudeGenerationError("No content generated from Claude")
-
-        logger.info(
-            f"Plan generation completed for plan_id={plan_id}, "
-            f"content_length={len(generated_content)}, messages={message_count}"
+        async with _sdk_slot():
+            async for message in sdk.query(prompt=prompt, options=options):
+                message_count += 1
+                if debug:
+                    logger.debug("Received message #%d from Claude SDK", message_count)
+                if isinstance(message, AssistantMessage):
+                    for block in message.content:
+                        if isinstance(block, TextBlock):
+                            if debug:
+                                logger.debug(
+                                    "Streaming text block with %d characters", len(block.text)
+                                )
+                            yield block.text
+                elif isinstance(message, ResultMessage):
+                    _log_prompt_cache_usage(
+                        f"Plan generation usage for plan_id={plan_id}", message.usage
+                    )
+                    if on_result is not None:
+                        on_result(message.total_cost_usd, message.duration_ms)
+
+        logger.debug(
+            "Plan generation stream finished for plan_id=%s, messages=%d", plan_id, message_count
         )
 
-        return GenerationResult(
-            content=generated_content,
-            total_cost_usd=None,
-            duration_ms=None,
-        )
-
-    except ImportError as e:
-        logger.error(f"Claude Agent SDK not installed: {e!r}", exc_info=True)
-        raise ClaudeNotConfiguredError(
-            "Claude Agent SDK not installed. Run: pip install claude-agent-sdk"
-        ) from e
     except Exception as e:
         logger.error(
             f"Plan generation failed for plan_id={plan_id}: {e!r}",
@@ -190,8 +453,10 @@ async def generate_plan_content(
         raise ClaudeGenerationError(f"Failed to generate plan content: {e}") from e
 
 
-# Prompt template for generating tasks from approved plans
-TASK_GENERATION_PROMPT = """You are a software project manager breaking down an approved implementation plan into discrete, actionable tasks.
+# Static instructions for generating tasks from approved plans, sent as the
+# system prompt (see PLAN_GENERATION_SYSTEM_PROMPT)
+TASK_GENERATION_SYSTEM_PROMPT = """\
+You are a software project manager breaking down an approved implementation plan into discrete, actionable tasks.
 
 Given the plan below, decompose it into a list of tasks that can be executed by developers (or coding agents). Each task should:
 
@@ -207,31 +472,30 @@ The tasks should form a DAG (Directed Acyclic Graph) where:
 
 Output your response as a JSON object with the following structure:
 ```json
-{{
+{
   "tasks": [
-    {{
+    {
       "title": "Task title",
       "description": "Detailed description of what needs to be done",
       "blocked_by_indices": []
-    }},
-    {{
+    },
+    {
       "title": "Another task",
       "description": "Description...",
       "blocked_by_indices": [0]
-    }}
+    }
   ]
-}}
+}
 ```
 
 Important:
 - blocked_by_indices is a list of 0-based indices referring to other tasks in the list
 - The first task has index 0, second has index 1, etc.
 - A task can only be blocked by tasks that appear BEFORE it in the list
-- Output ONLY the JSON object, no additional text or markdown
+- Output ONLY the JSON object, no additional text or markdown"""
 
----
-
-**Plan Title**: {title}
+# Per-request part of the task generation prompt
+TASK_GENERATION_PROMPT = """**Plan Title**: {title}
 
 **Plan Content**:
 {content}
@@ -266,9 +530,29 @@ async def generate_tasks_from_plan(
     """
     if not subscription_token:
         raise ClaudeNotConfiguredError(
-            "No Claude Code subscription token available. Users should add tokens via /claude-tokens API."
+            "No Claude Code subscription token available. "
+            "Users should add tokens via /claude-tokens API."
         )
 
+    # Every spawn is an explicit user request, often a re-spawn after deleting
+    # the previous tasks, so results aren't cached; identical requests already
+    # in flight still share one Claude call
+    key = _GenerationCache.make_key("tasks", title, content, project_context)
+
+    async def run() -> TaskGenerationResult:
+        return await _generate_tasks(plan_id, title, content, project_context, subscription_token)
+
+    return await _coalesce(key, run)
+
+
+async def _generate_tasks(
+    plan_id: UUID,
+    title: str,
+    content: str,
+    project_context: str | None,
+    subscription_token: str,
+) -> TaskGenerationResult:
+    """Build the task prompt, run a single generation and parse the tasks."""
     # Build context section
     context_section = ""
     if project_context:
@@ -280,45 +564,65 @@ async def generate_tasks_from_plan(
         context_section=context_section,
     )
 
-    try:
-        # Import here to avoid import errors if SDK not installed
-        from claude_agent_sdk import (
-            AssistantMessage,
-            ClaudeAgentOptions,
-            TextBlock,
-            query,
-        )
+    sdk = _load_sdk()
+    # Bind the message types locally for the per-message isinstance checks
+    AssistantMessage, ResultMessage, TextBlock = (
+        sdk.AssistantMessage,
+        sdk.ResultMessage,
+        sdk.TextBlock,
+    )
 
+    try:
         logger.info(f"Starting task generation for plan_id={plan_id}, title='{title}'")
-        logger.debug(f"Prompt length: {len(prompt)} characters, content length: {len(content)} characters")
+        logger.debug(
+            "Prompt length: %d characters, content length: %d characters", len(prompt), len(content)
+        )
 
         # Configure options for task generation
         # Pass subscription token to Claude Code CLI via environment variable
         # The CLI handles all API communication internally
-        options = ClaudeAgentOptions(
+        options = sdk.ClaudeAgentOptions(
+            system_prompt=TASK_GENERATION_SYSTEM_PROMPT,
             max_turns=1,
             env={"ANTHROPIC_API_KEY": subscription_token},
         )
 
-        # Use query() async iterator to collect responses
-        content_parts: list[str] = []
+        # Use query() async iterator to collect newline-separated text blocks
+        buffer = io.StringIO()
+        separator = ""
+        total_cost_usd: float | None = None
+        duration_ms: int | None = None
+        debug = logger.isEnabledFor(logging.DEBUG)
         message_count = 0
-        async for message in query(prompt=prompt, options=options):
-            message_count += 1
-            logger.debug(f"Received message #{message_count} from Claude SDK for task generation")
-            if isinstance(message, AssistantMessage):
-                for block in message.content:
-                    if isinstance(block, TextBlock):
-                        content_parts.append(block.text)
-                        logger.debug(f"Added text block with {len(block.text)} characters")
-
-        generated_content = "\n".join(content_parts)
+        async with _sdk_slot():
+            async for message in sdk.query(prompt=prompt, options=options):
+                message_count += 1
+                if debug:
+                    logger.debug(
+                        "Received message #%d from Claude SDK for task generation", message_count
+                    )
+                if isinstance(message, AssistantMessage):
+                    for block in message.content:
+                        if isinstance(block, TextBlock):
+                            buffer.write(separator)
+                            buffer.write(block.text)
+                            separator = "\n"
+                            if debug:
+                                logger.debug("Added text block with %d characters", len(block.text))
+                elif isinstance(message, ResultMessage):
+                    total_cost_usd = message.total_cost_usd
+                    duration_ms = message.duration_ms
+                    _log_prompt_cache_usage(
+                        f"Task generation usage for plan_id={plan_id}", message.usage
+                    )
+
+        generated_content = buffer.getvalue()
 
         if not generated_content:
             logger.error(f"No content generated from Claude for task generation, plan_id={plan_id}")
             raise ClaudeGenerationError("No content generated from Claude")
 
-        logger.debug(f"Parsing tasks from {len(generated_content)} characters of response")
+        logger.debug("Parsing tasks from %d characters of response", len(generated_content))
 
         # Parse the JSON response
         tasks = _parse_tasks_from_response(generated_content)
@@ -330,15 +634,10 @@ async def generate_tasks_from_plan(
 
         return TaskGenerationResult(
             tasks=tasks,
-            total_cost_usd=None,
-            duration_ms=None,
+            total_cost_usd=total_cost_usd,
+            duration_ms=duration_ms,
         )
 
-    except ImportError as e:
-        logger.error(f"Claude Agent SDK not installed: {e!r}", exc_info=True)
-        raise ClaudeNotConfiguredError(
-            "Claude Agent SDK not installed. Run: pip install claude-agent-sdk"
-        ) from e
     except ClaudeGenerationError:
         raise
     except Exception as e:
@@ -349,6 +648,48 @@ async def generate_tasks_from_plan(
         raise ClaudeGenerationError(f"Failed to generate tasks from plan: {e}") from e
 
 
+class _RawTask(BaseModel):
+    """Shape of a single task in Claude's task generation response."""
+
+    title: StrictStr = Field(min_length=1)
+    description: StrictStr = Field(min_length=1)
+    blocked_by_indices: list[Any] = Field(default_factory=list)
+
+    @field_validator("blocked_by_indices", mode="before")
+    @classmethod
+    def default_non_list(cls, v: Any) -> Any:
+        """Treat a malformed dependency list as no dependencies."""
+        if isinstance(v, list):
+            return v
+        logger.warning("Task has invalid blocked_by_indices (not a list), using empty list")
+        return []
+
+
+class _RawTaskList(BaseModel):
+    """Top-level shape of Claude's task generation response."""
+
+    tasks: list[_RawTask]
+
+
+def _describe_task_validation_error(error: ValidationError) -> str:
+    """Map the first validation error to the parser's error messages."""
+    first = error.errors()[0]
+    if first["type"] == "json_invalid":
+        return f"Failed to parse tasks JSON: {first['msg']}"
+    loc = first["loc"]
+    if len(loc) <= 1 and (not loc or first["type"] == "missing"):
+        return "Invalid response format: missing 'tasks' key"
+    if len(loc) == 1:
+        return "Invalid response format: 'tasks' must be a list"
+    if len(loc) == 2:
+        return f"Invalid task at index {loc[1]}: must be an object"
+    return f"Invalid task at index {loc[1]}: missing or invalid '{loc[2]}'"
+
+
+# Matches the first fenced code block, with or without a "json" language tag
+_JSON_FENCE_RE = re.compile(r"```(?:json)?(.*?)```", re.DOTALL)
+
+
 def _parse_tasks_from_response(response: str) -> list[GeneratedTask]:
     """Parse the JSON response from Claude into GeneratedTask objects.
 
@@ -361,80 +702,53 @@ def _parse_tasks_from_response(response: str) -> list[GeneratedTask]:
     Raises:
         ClaudeGenerationError: If parsing fails
     """
-    logger.debug(f"Parsing task response with {len(response)} characters")
-
-    # Try to extract JSON from the response (in case there's surrounding text)
-    json_str = response.strip()
-
-    # Handle markdown code blocks
-    if "```json" in json_str:
-        logger.debug("Found JSON markdown code block in response")
-        start = json_str.find("```json") + 7
-        end = json_str.find("```", start)
-        json_str = json_str[start:end].strip()
-    elif "```" in json_str:
-        logger.debug("Found generic markdown code block in response")
-        start = json_str.find("```") + 3
-        end = json_str.find("```", start)
-        json_str = json_str[start:end].strip()
+    logger.debug("Parsing task response with %d characters", len(response))
 
+    # Extract JSON from a markdown code block if present, else use the whole response
+    match = _JSON_FENCE_RE.search(response)
+    if match:
+        logger.debug("Found markdown code block in response")
+        json_str = match.group(1).strip()
+    else:
+        json_str = response.strip()
+
+    # Parse and validate in one pass through pydantic-core
     try:
-        data = json.loads(json_str)
-        logger.debug(f"Successfully parsed JSON with keys: {list(data.keys())}")
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse tasks JSON: {e!r}", exc_info=True)
-        logger.debug(f"Failed JSON string (first 500 chars): {json_str[:500]}")
-        raise ClaudeGenerationError(f"Failed to parse tasks JSON: {e}") from e
-
-    if not isinstance(data, dict) or "tasks" not in data:
-        logger.error(f"Invalid response format: missing 'tasks' key. Keys found: {list(data.keys())}")
-        raise ClaudeGenerationError("Invalid response format: missing 'tasks' key")
-
-    tasks_data = data["tasks"]
-    if not isinstance(tasks_data, list):
-        logger.error(f"Invalid response format: 'tasks' is {type(tasks_data)} instead of list")
-        raise ClaudeGenerationError("Invalid response format: 'tasks' must be a list")
-
-    logger.debug(f"Parsing {len(tasks_data)} tasks from response")
-
-    tasks: list[GeneratedTask] = []
-    for i, task_data in enumerate(tasks_data):
-        if not isinstance(task_data, dict):
-            logger.error(f"Invalid task at index {i}: {type(task_data)} instead of dict")
-            raise ClaudeGenerationError(f"Invalid task at index {i}: must be an object")
-
-        title = task_data.get("title")
-        description = task_data.get("description")
-
-        if not title or not isinstance(title, str):
-            logger.error(f"Invalid task at index {i}: missing or invalid title")
-            raise ClaudeGenerationError(f"Invalid task at index {i}: missing or invalid 'title'")
-        if not description or not isinstance(description, str):
-            logger.error(f"Invalid task at index {i}: missing or invalid description")
-            raise ClaudeGenerationError(f"Invalid task at index {i}: missing or invalid 'description'")
-
-        blocked_by = task_data.get("blocked_by_indices", [])
-        if not isinstance(blocked_by, list):
-            logger.warning(f"Task {i} has invalid blocked_by_indices (not a list), using empty list")
-            blocked_by = []
-
-        # Validate blocked_by indices
-        valid_blocked_by = []
-        for idx in blocked_by:
-            if isinstance(idx, int) and 0 <= idx < i:
-                valid_blocked_by.append(idx)
-            else:
-                logger.warning(f"Task {i} ('{title}') has invalid blocked_by index {idx}, skipping")
-
-        logger.debug(f"Parsed task {i}: '{title}' with {len(valid_blocked_by)} dependencies")
-
-        tasks.append(GeneratedTask(
-            title=title,
-            description=description,
-            blocked_by_indices=valid_blocked_by,
-        ))
+        raw_tasks = _RawTaskList.model_validate_json(json_str).tasks
+    except ValidationError as e:
+        message = _describe_task_validation_error(e)
+        logger.error(message)
+        logger.debug("Failed JSON string (first 500 chars): %.500s", json_str)
+        raise ClaudeGenerationError(message) from e
+
+    logger.debug("Parsing %d tasks from response", len(raw_tasks))
+
+    warn = logger.isEnabledFor(logging.WARNING)
+    tasks = []
+    for i, raw in enumerate(raw_tasks):
+        blocked_by = raw.blocked_by_indices
+        # Keep only integer (not bool) indices that point at earlier tasks
+        valid_blocked_by = (
+            [idx for idx in blocked_by if type(idx) is int and 0 <= idx < i] if blocked_by else []
+        )
+        if warn and len(valid_blocked_by) != len(blocked_by):
+            for idx in blocked_by:
+                if not (type(idx) is int and 0 <= idx < i):
+                    logger.warning(
+                        "Task %d ('%s') has invalid blocked_by index %r, skipping",
+                        i,
+                        raw.title,
+                        idx,
+                    )
+        tasks.append(
+            GeneratedTask(
+                title=raw.title,
+                description=raw.description,
+                blocked_by_indices=valid_blocked_by,
+            )
+        )
 
-    logger.debug(f"Successfully parsed {len(tasks)} tasks")
+    logger.debug("Successfully parsed %d tasks", len(tasks))
     return tasks
 
 
@@ -452,6 +766,7 @@ class ClaudeService:
         context: str | None = None,
         project_context: str | None = None,
         subscription_token: str | None = None,
+        use_cache: bool = False,
     ) -> GenerationResult:
         """Generate plan content.
 
@@ -461,6 +776,7 @@ class ClaudeService:
             context: Additional user-provided context
             project_context: Project-specific context
             subscription_token: Claude Code subscription token from pool rotation
+            use_cache: Return a recent result for the same plan and inputs
 
         Returns:
             GenerationResult with generated content
@@ -475,6 +791,7 @@ class ClaudeService:
             context=context,
             project_context=project_context,
             subscription_token=subscription_token,
+            use_cache=use_cache,
         )
 
     async def generate_tasks(
@@ -8,6 +8,7 @@ be decrypted when needed for API calls.
 import base64
 import hashlib
 import logging
+from functools import lru_cache
 
 from cryptography.fernet import Fernet, InvalidToken
 
@@ -16,21 +17,25 @@ from app.config import settings
 logger = logging.getLogger(__name__)
 
 
-def _get_fernet_key() -> bytes:
-    """Derive a Fernet-compatible key from the JWT secret.
+@lru_cache(maxsize=1)
+def _fernet_for_secret(secret: str) -> Fernet:
+    """Build the Fernet instance for a JWT secret.
 
     Fernet requires a 32-byte base64-encoded key.
     We derive this from the JWT secret using SHA-256.
     """
     # Use SHA-256 to get a consistent 32-byte key from the secret
-    key_bytes = hashlib.sha256(settings.jwt_secret_key.encode()).digest()
+    key_bytes = hashlib.sha256(secret.encode()).digest()
     # Fernet expects base64-encoded key
-    return base64.urlsafe_b64encode(key_bytes)
+    return Fernet(base64.urlsafe_b64encode(key_bytes))
 
 
 def _get_fernet() -> Fernet:
-    """Get a Fernet instance for encryption/decryption."""
-    return Fernet(_get_fernet_key())
+    """Get the Fernet instance for encryption/decryption.
+
+    Cached per secret, so a changed jwt_secret_key still takes effect.
+    """
+    return _fernet_for_secret(settings.jwt_secret_key)
 
 
 def encrypt_token(plaintext_token: str) -> str:
@@ -80,10 +85,10 @@ def mask_token(plaintext_token: str) -> str:
     Returns:
         Masked token string safe for display
     """
-    if len(plaintext_token) <= 8:
+    length = len(plaintext_token)
+    if length <= 8:
         return "****"
 
     # Show prefix (up to first 8 chars) and last 4 chars
-    prefix = plaintext_token[:8] if len(plaintext_token) > 12 else plaintext_token[:4]
-    suffix = plaintext_token[-4:]
-    return f"{prefix}...{suffix}"
+    prefix_length = 8 if length > 12 else 4
+    return f"{plaintext_token[:prefix_length]}...{plaintext_token[-4:]}"
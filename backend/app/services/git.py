@@ -3,10 +3,16 @@
 Uses GitPython for git operations instead of subprocess calls.
 """
 
+import io
+import itertools
+import logging
+import os
 import re
 import shutil
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, TextIO
 from uuid import UUID
 
 from git import GitCommandError, InvalidGitRepositoryError, Repo
@@ -14,6 +20,8 @@ from pydantic import BaseModel
 
 from app.schemas.task import FileDiff, FileStatus
 
+logger = logging.getLogger(__name__)
+
 
 class GitError(Exception):
     """Exception raised for git operation errors."""
@@ -71,88 +79,292 @@ def get_current_branch(repo_path: str | Path) -> str:
         raise GitError(f"Failed to get current branch: {e}") from e
 
 
-def _parse_diff_stat_line(line: str) -> tuple[str, FileStatus, int, int] | None:
-    """Parse a single line from git diff --numstat output.
+def iter_file_diffs(
+    repo_path: str | Path,
+    base_branch: str,
+    head_branch: str | None = None,
+) -> Iterator[FileDiff]:
+    """Diff two branches and yield one FileDiff per changed file.
+
+    git is started and the per-file status records are read before this
+    returns, so failures raise here rather than partway through iteration.
+    Patches are then read from git's output one file at a time as the
+    caller consumes them. git's exit status is checked once the last file
+    has been read, so a late failure raises GitError at the end of iteration;
+    callers that must report it before producing output should consume the
+    iterator fully first.
+
+    Diff text is decoded as UTF-8 with undecodable bytes replaced by U+FFFD,
+    so patches of files in other encodings stay JSON-serializable instead of
+    carrying lone surrogates.
 
     Args:
-        line: A line from numstat output (e.g., "10\t5\tpath/to/file.py")
+        repo_path: Path to the git repository (or worktree).
+        base_branch: Base branch to compare against.
+        head_branch: Head branch (current branch if None).
 
     Returns:
-        Tuple of (path, status, additions, deletions) or None if line is invalid.
+        Iterator over the changed files, in git's numstat order.
+
+    Raises:
+        GitError: If diff generation fails.
     """
-    parts = line.split("\t")
-    if len(parts) != 3:
-        return None
+    try:
+        repo = Repo(repo_path)
+    except InvalidGitRepositoryError as e:
+        raise GitError(f"Invalid git repository: {repo_path}") from e
 
-    additions_str, deletions_str, path = parts
+    if head_branch is None:
+        head_branch = get_current_branch(repo_path)
 
-    # Binary files show "-" for additions/deletions
-    additions = 0 if additions_str == "-" else int(additions_str)
-    deletions = 0 if deletions_str == "-" else int(deletions_str)
+    try:
+        # Get the merge base to find common ancestor
+        try:
+            merge_base = repo.git.merge_base(base_branch, head_branch).strip()
+        except GitCommandError:
+            # If merge-base fails, try direct comparison
+            merge_base = base_branch
 
-    # Determine status based on additions/deletions
-    # This is a simplified heuristic; actual status comes from --name-status
-    if deletions == 0 and additions > 0:
-        status = FileStatus.ADDED
-    elif additions == 0 and deletions > 0:
-        status = FileStatus.DELETED
-    else:
-        status = FileStatus.MODIFIED
+        # Statuses, line counts and patches from a single git invocation.
+        # The NUL-separated records come first; only they are read up front.
+        # Explicit prefixes keep the patch headers parseable whatever the
+        # user's diff.noprefix / diff.mnemonicPrefix settings are.
+        proc = repo.git.diff(
+            "--no-color",
+            "--src-prefix=a/",
+            "--dst-prefix=b/",
+            "--raw",
+            "--numstat",
+            "--patch",
+            "-z",
+            merge_base,
+            head_branch,
+            as_process=True,
+        )
+        # Non-UTF-8 bytes become U+FFFD (see docstring)
+        stream = io.TextIOWrapper(
+            proc.stdout, encoding="utf-8", errors="replace", newline="\n"
+        )
+        records, first_line = _read_diff_records(stream)
+        if not records:
+            # Either nothing changed or git failed before writing anything
+            stream.close()
+            proc.wait()
+            return iter(())
+    except GitCommandError as e:
+        raise GitError(f"Git diff failed: {e.stderr}") from e
 
-    return path, status, additions, deletions
+    try:
+        entries = _parse_diff_records(records)
+    except GitError:
+        stream.close()
+        raise
+    return _stream_file_diffs(proc, stream, entries, first_line)
 
 
-def _parse_name_status(output: str) -> dict[str, FileStatus]:
-    """Parse git diff --name-status output to get file statuses.
+_RAW_STATUS_MAP = {
+    "A": FileStatus.ADDED,
+    "M": FileStatus.MODIFIED,
+    "D": FileStatus.DELETED,
+    "R": FileStatus.RENAMED,
+}
 
-    Args:
-        output: Output from git diff --name-status.
+
+def _read_diff_records(stream: TextIO) -> tuple[str, str]:
+    """Read the raw/numstat records at the start of `git diff -z` output.
+
+    The records end with an empty NUL-terminated field, directly followed by
+    the first patch line.
 
     Returns:
-        Dict mapping file paths to their status.
+        The records, and the first patch line (empty if there is none).
     """
-    status_map = {
-        "A": FileStatus.ADDED,
-        "M": FileStatus.MODIFIED,
-        "D": FileStatus.DELETED,
-        "R": FileStatus.RENAMED,
-    }
-
-    result: dict[str, FileStatus] = {}
-    for line in output.strip().split("\n"):
-        if not line:
-            continue
-        parts = line.split("\t")
-        if len(parts) >= 2:
-            status_char = parts[0][0]  # First char of status (R100 -> R)
-            path = parts[-1]  # Last part is the new name (for renames)
-            result[path] = status_map.get(status_char, FileStatus.MODIFIED)
+    buffer = ""
+    while line := stream.readline():
+        buffer += line
+        records, separator, first_line = buffer.partition("\0\0")
+        if separator:
+            return records, first_line
+    return buffer, ""
 
-    return result
 
+def _parse_diff_records(records: str) -> list[tuple[FileStatus, str, int, int]]:
+    """Parse the raw and numstat records of `git diff --raw --numstat -z`.
 
-def _extract_file_patch(full_diff: str, file_path: str) -> str:
-    """Extract the patch for a specific file from a full diff output.
+    Raw records list every file first, then numstat records follow in the
+    same order, so the two are matched up by position and each pair is
+    checked to name the same path.
 
     Args:
-        full_diff: Full git diff output.
-        file_path: Path to extract patch for.
+        records: NUL-separated raw and numstat records.
 
     Returns:
-        Unified diff patch for the file, or empty string if not found.
+        (status, path, additions, deletions) per changed file, in git's order.
+
+    Raises:
+        GitError: If a numstat record names a different file than its raw record.
     """
-    # Escape special regex characters in file path
-    escaped_path = re.escape(file_path)
+    fields = records.split("\0")
+
+    # Raw records: ":<modes> <shas> <status>" then the path, or for renames
+    # and copies the source and destination paths
+    entries: list[tuple[FileStatus, str]] = []
+    i = 0
+    while i < len(fields) and fields[i].startswith(":"):
+        status_char = fields[i].rpartition(" ")[2][:1]
+        i += 3 if status_char in ("R", "C") else 2
+        entries.append((_RAW_STATUS_MAP.get(status_char, FileStatus.MODIFIED), fields[i - 1]))
+
+    parsed: list[tuple[FileStatus, str, int, int]] = []
+    for status, path in entries:
+        # Numstat records: "<added>\t<deleted>\t<path>", with an empty path
+        # followed by source and destination fields for renames and copies
+        additions_str, deletions_str, numstat_path = fields[i].split("\t", 2)
+        if numstat_path:
+            i += 1
+        else:
+            numstat_path = fields[i + 2]
+            i += 3
+        if numstat_path != path:
+            raise GitError(
+                f"Git diff records disagree: raw path {path!r}, numstat path {numstat_path!r}"
+            )
 
-    # Pattern to match file header and capture until next file or end
-    # Handles both regular and renamed files
-    pattern = rf"(diff --git [^\n]*{escaped_path}[^\n]*\n(?:(?!diff --git ).)*)"
+        # Binary files show "-" for additions/deletions
+        additions = 0 if additions_str == "-" else int(additions_str)
+        deletions = 0 if deletions_str == "-" else int(deletions_str)
+        parsed.append((status, path, additions, deletions))
+
+    return parsed
+
+
+def _iter_patch_sections(lines: Iterable[str]) -> Iterator[str]:
+    """Group diff output lines into one patch per "diff --git" section."""
+    section: list[str] = []
+    for line in lines:
+        # Content lines are prefixed with " ", "+" or "-", so this is a header
+        if line.startswith("diff --git ") and section:
+            yield "".join(section).strip()
+            section = []
+        section.append(line)
+    if section:
+        yield "".join(section).strip()
+
+
+# Escapes git uses when it C-quotes a path in patch headers
+_QUOTED_PATH_ESCAPES = {
+    "a": b"\a",
+    "b": b"\b",
+    "f": b"\f",
+    "n": b"\n",
+    "r": b"\r",
+    "t": b"\t",
+    "v": b"\v",
+    '"': b'"',
+    "\\": b"\\",
+}
+
+
+def _unquote_path(path: str) -> str:
+    """Undo git's C-style quoting of a path in a patch header.
+
+    Paths with control characters, quotes, backslashes or (by default)
+    non-ASCII bytes are written as "..." with backslash and octal escapes.
+    Unquoted paths are returned unchanged.
+    """
+    if len(path) < 2 or path[0] != '"' or path[-1] != '"':
+        return path
+
+    body = path[1:-1]
+    decoded = bytearray()
+    i = 0
+    while i < len(body):
+        char = body[i]
+        if char != "\\":
+            decoded += char.encode()
+            i += 1
+        elif body[i + 1 : i + 2].isdigit():
+            decoded.append(int(body[i + 1 : i + 4], 8))
+            i += 4
+        else:
+            decoded += _QUOTED_PATH_ESCAPES.get(body[i + 1 : i + 2], body[i + 1 : i + 2].encode())
+            i += 2
+    return decoded.decode("utf-8", errors="replace")
+
+
+def _section_path(section: str) -> str:
+    """Return the path a "diff --git" section belongs to.
 
-    match = re.search(pattern, full_diff, re.DOTALL)
-    if match:
-        return match.group(1).strip()
+    This is the new path for renames and copies, matching the path git
+    reports for the file in its raw record.
+    """
+    header, _, rest = section.partition("\n")
+
+    # Renames and copies name the new path explicitly in the extended header
+    for line in rest.split("\n"):
+        if line.startswith(("--- ", "+++ ", "@@", "Binary files ")):
+            break
+        if line.startswith(("rename to ", "copy to ")):
+            return _unquote_path(line.split(" ", 2)[2])
+
+    # Otherwise the header names the same path twice: a/<path> b/<path>
+    names = header[len("diff --git ") :]
+    if names.startswith('"'):
+        i = 1
+        while i < len(names) and names[i] != '"':
+            i += 2 if names[i] == "\\" else 1
+        return _unquote_path(names[: i + 1])[2:]
+    half = (len(names) - 1) // 2
+    if names[half : half + 3] == " b/" and names[2:half] == names[half + 3 :]:
+        return names[2:half]
+    return names.rpartition(" b/")[2]
+
+
+def _stream_file_diffs(
+    proc: Any,
+    stream: TextIO,
+    entries: list[tuple[FileStatus, str, int, int]],
+    first_line: str,
+) -> Iterator[FileDiff]:
+    """Yield FileDiffs, reading each file's patch from git only when needed.
+
+    Patch sections come in the same order as the records, but are matched to
+    them by path: a type change (e.g. symlink to regular file) has a single
+    record and two sections, which are joined into one patch. If the caller
+    stops early, GitPython terminates the git process once `proc` is released.
+    """
+    try:
+        sections = (
+            (_section_path(section), section)
+            for section in _iter_patch_sections(itertools.chain([first_line], stream))
+        )
+        pending = next(sections, None)
+        for status, path, additions, deletions in entries:
+            patches: list[str] = []
+            while pending is not None and pending[0] == path:
+                patches.append(pending[1])
+                pending = next(sections, None)
+            if not patches:
+                # Every change gets a section, so this is a header we failed
+                # to read; leave the patch empty rather than misattribute one
+                logger.warning(
+                    f"No patch section for {path!r}; next section is for "
+                    f"{pending[0] if pending else None!r}"
+                )
+            yield FileDiff(
+                path=path,
+                status=status,
+                additions=additions,
+                deletions=deletions,
+                patch="\n".join(patches),
+            )
+    finally:
+        stream.close()
 
-    return ""
+    try:
+        proc.wait()
+    except GitCommandError as e:
+        raise GitError(f"Git diff failed: {e.stderr}") from e
 
 
 def generate_diff(
@@ -173,67 +385,15 @@ def generate_diff(
     Raises:
         GitError: If diff generation fails.
     """
-    try:
-        repo = Repo(repo_path)
-    except InvalidGitRepositoryError as e:
-        raise GitError(f"Invalid git repository: {repo_path}") from e
-
     if head_branch is None:
         head_branch = get_current_branch(repo_path)
 
-    try:
-        # Get the merge base to find common ancestor
-        try:
-            merge_base = repo.git.merge_base(base_branch, head_branch).strip()
-        except GitCommandError:
-            # If merge-base fails, try direct comparison
-            merge_base = base_branch
-
-        # Get file statuses
-        name_status_output = repo.git.diff("--name-status", merge_base, head_branch)
-        file_statuses = _parse_name_status(name_status_output)
-
-        # Get numstat for additions/deletions count
-        numstat_output = repo.git.diff("--numstat", merge_base, head_branch)
-
-        # Get full diff for patches
-        full_diff = repo.git.diff(merge_base, head_branch)
-
-        # Parse numstat and combine with status and patches
-        files: list[FileDiff] = []
-        for line in numstat_output.strip().split("\n"):
-            if not line:
-                continue
-
-            parsed = _parse_diff_stat_line(line)
-            if parsed is None:
-                continue
-
-            path, _, additions, deletions = parsed
-
-            # Get actual status from name-status (more accurate)
-            status = file_statuses.get(path, FileStatus.MODIFIED)
-
-            # Extract patch for this file
-            patch = _extract_file_patch(full_diff, path)
-
-            files.append(
-                FileDiff(
-                    path=path,
-                    status=status,
-                    additions=additions,
-                    deletions=deletions,
-                    patch=patch,
-                )
-            )
-
-        return DiffResult(
-            base_branch=base_branch,
-            head_branch=head_branch,
-            files=files,
-        )
-    except GitCommandError as e:
-        raise GitError(f"Git diff failed: {e.stderr}") from e
+    files = list(iter_file_diffs(repo_path, base_branch, head_branch))
+    return DiffResult(
+        base_branch=base_branch,
+        head_branch=head_branch,
+        files=files,
+    )
 
 
 def get_diff_for_file(
@@ -262,6 +422,9 @@ def get_diff_for_file(
     return None
 
 
+_HUNK_HEADER_RE = re.compile(r"@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
 def parse_hunk_header(header: str) -> tuple[int, int, int, int] | None:
     """Parse a unified diff hunk header.
 
@@ -271,7 +434,7 @@ def parse_hunk_header(header: str) -> tuple[int, int, int, int] | None:
     Returns:
         Tuple of (old_start, old_count, new_start, new_count) or None if invalid.
     """
-    match = re.match(r"@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@", header)
+    match = _HUNK_HEADER_RE.match(header)
     if not match:
         return None
 
@@ -283,7 +446,7 @@ def parse_hunk_header(header: str) -> tuple[int, int, int, int] | None:
     return old_start, old_count, new_start, new_count
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DiffLine:
     """Represents a single line in a diff."""
 
@@ -293,67 +456,55 @@ class DiffLine:
     new_line_number: int | None  # Line number in new file (None for deletions)
 
 
-def parse_patch_lines(patch: str) -> list[DiffLine]:
-    """Parse a unified diff patch into individual lines with line numbers.
+def iter_patch_lines(patch: str) -> Iterator[DiffLine]:
+    """Parse a unified diff patch lazily, one line at a time.
 
     Args:
         patch: Unified diff patch string.
 
-    Returns:
-        List of DiffLine objects with line number information.
+    Yields:
+        DiffLine objects with line number information, in patch order.
     """
-    lines: list[DiffLine] = []
     old_line = 0
     new_line = 0
 
+    # Dispatch on the first character; file headers ("diff --git", "index",
+    # "new file mode", ...) match no branch and are skipped
     for line in patch.split("\n"):
-        if line.startswith("@@"):
+        c = line[:1]
+        if c == "+":
+            if line.startswith("+++"):
+                continue
+            new_line += 1
+            yield DiffLine("add", line[1:], None, new_line)
+        elif c == "-":
+            if line.startswith("---"):
+                continue
+            old_line += 1
+            yield DiffLine("delete", line[1:], old_line, None)
+        elif c == " " or not c:
+            old_line += 1
+            new_line += 1
+            yield DiffLine("context", line[1:], old_line, new_line)
+        elif c == "@" and line.startswith("@@"):
             parsed = parse_hunk_header(line)
             if parsed:
                 old_line, _, new_line, _ = parsed
                 # Don't decrement here; first line starts at the header position
                 old_line -= 1
                 new_line -= 1
-            continue
 
-        if line.startswith("diff --git") or line.startswith("index "):
-            continue
-        if line.startswith("---") or line.startswith("+++"):
-            continue
 
-        if line.startswith("+"):
-            new_line += 1
-            lines.append(
-                DiffLine(
-                    type="add",
-                    content=line[1:],
-                    old_line_number=None,
-                    new_line_number=new_line,
-                )
-            )
-        elif line.startswith("-"):
-            old_line += 1
-            lines.append(
-                DiffLine(
-                    type="delete",
-                    content=line[1:],
-                    old_line_number=old_line,
-                    new_line_number=None,
-                )
-            )
-        elif line.startswith(" ") or line == "":
-            old_line += 1
-            new_line += 1
-            lines.append(
-                DiffLine(
-                    type="context",
-                    content=line[1:] if line.startswith(" ") else "",
-                    old_line_number=old_line,
-                    new_line_number=new_line,
-                )
-            )
+def parse_patch_lines(patch: str) -> list[DiffLine]:
+    """Parse a unified diff patch into individual lines with line numbers.
+
+    Args:
+        patch: Unified diff patch string.
 
-    return lines
+    Returns:
+        List of DiffLine objects with line number information.
+    """
+    return list(iter_patch_lines(patch))
 
 
 def validate_comment_line_number(
@@ -371,14 +522,11 @@ def validate_comment_line_number(
     Returns:
         True if the line number exists in the diff.
     """
-    diff_lines = parse_patch_lines(patch)
-
-    for diff_line in diff_lines:
-        if side == "new" and diff_line.new_line_number == line_number:
-            return True
-        if side == "old" and diff_line.old_line_number == line_number:
-            return True
-
+    # Stop at the first matching line instead of parsing the whole patch
+    if side == "new":
+        return any(dl.new_line_number == line_number for dl in iter_patch_lines(patch))
+    if side == "old":
+        return any(dl.old_line_number == line_number for dl in iter_patch_lines(patch))
     return False
 
 
@@ -394,6 +542,9 @@ class WorktreeResult(BaseModel):
     branch_name: str
 
 
+_SLUG_SEPARATOR_RE = re.compile(r"[^a-z0-9]+")
+
+
 def _slugify(text: str, max_length: int = 50) -> str:
     """Convert text to a git-branch-safe slug.
 
@@ -402,11 +553,8 @@ def _slugify(text: str, max_length: int = 50) -> str:
     - Remove consecutive hyphens
     - Truncate to max_length
     """
-    slug = text.lower()
-    slug = re.sub(r"[^a-z0-9]+", "-", slug)
-    slug = re.sub(r"-+", "-", slug)
-    slug = slug.strip("-")
-    return slug[:max_length]
+    # Each run of other characters becomes one hyphen, so no collapse pass is needed
+    return _SLUG_SEPARATOR_RE.sub("-", text.lower()).strip("-")[:max_length]
 
 
 def _generate_branch_name(task_id: UUID, title: str) -> str:
@@ -477,7 +625,12 @@ def branch_exists(repo: Repo, branch_name: str) -> bool:
     Returns:
         True if branch exists, False otherwise
     """
-    return branch_name in [ref.name for ref in repo.references if ref.name == branch_name]
+    # Direct ref lookup instead of listing every reference
+    try:
+        repo.git.show_ref("--verify", "--quiet", f"refs/heads/{branch_name}")
+    except GitCommandError:
+        return False
+    return True
 
 
 def get_worktrees(repo: Repo) -> dict[str, str]:
@@ -515,8 +668,23 @@ def worktree_exists_at_path(repo: Repo, worktree_path: Path) -> bool:
     Returns:
         True if worktree exists at path, False otherwise
     """
-    worktrees = get_worktrees(repo)
-    return str(worktree_path) in worktrees
+    # Each linked worktree has an admin dir whose "gitdir" file holds the
+    # worktree's .git path, so no need to spawn `git worktree list`.
+    admin_root = Path(repo.common_dir) / "worktrees"
+    target = worktree_path.resolve()
+    try:
+        entries = os.scandir(admin_root)
+    except OSError:
+        return False
+    with entries:
+        for entry in entries:
+            try:
+                gitdir = (Path(entry.path) / "gitdir").read_text().strip()
+            except OSError:
+                continue
+            if Path(gitdir).parent.resolve() == target:
+                return True
+    return False
 
 
 def create_worktree(
@@ -59,9 +59,6 @@ async def run_plan_generation(
     """
     logger.info(f"Starting plan generation job for plan_id={plan_id}, title='{title}'")
 
-    from sqlalchemy import create_engine
-    from sqlalchemy.orm import sessionmaker
-
     from app.models.enums import ProcessingStatus
     from app.models.plan import Plan as PlanModel
     from app.services.claude import (
@@ -72,11 +69,9 @@ async def run_plan_generation(
 
     plan_uuid = UUID(plan_id)
 
-    # Create database session for this job
+    # Create database session for this job from the worker's shared pool
     logger.debug(f"Creating database session for plan generation job {plan_id}")
-    engine = create_engine(settings.database_url)
-    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
-    db = SessionLocal()
+    db = ctx["session_factory"]()
 
     try:
         plan = db.query(PlanModel).filter(PlanModel.id == plan_uuid).first()
@@ -100,6 +95,14 @@ async def run_plan_generation(
         subscription_token, token_id = token_result
         logger.info(f"Using subscription token {token_id} for plan generation {plan_id}")
 
+        # Every generate call is an explicit request for fresh content; only a
+        # retry of this job may reuse what an earlier attempt generated.
+        use_cache = ctx.get("job_try", 1) > 1
+
+        # End the transaction so its pooled connection isn't held idle for
+        # the whole Claude call; the plan reloads on its next access.
+        db.commit()
+
         try:
             result = await claude_service.generate_plan(
                 plan_id=plan_uuid,
@@ -107,6 +110,7 @@ async def run_plan_generation(
                 context=context,
                 project_context=project_context,
                 subscription_token=subscription_token,
+                use_cache=use_cache,
             )
 
             plan.content = result.content
@@ -122,6 +126,8 @@ async def run_plan_generation(
                 "success": True,
                 "plan_id": plan_id,
                 "content_length": len(result.content),
+                "total_cost_usd": result.total_cost_usd,
+                "duration_ms": result.duration_ms,
             }
 
         except (ClaudeNotConfiguredError, ClaudeGenerationError) as e:
@@ -154,7 +160,6 @@ async def run_plan_generation(
 
     finally:
         db.close()
-        engine.dispose()
 
 
 async def run_task_spawning(
@@ -171,9 +176,6 @@ async def run_task_spawning(
     """
     logger.info(f"Starting task spawning job for plan_id={plan_id}, title='{title}'")
 
-    from sqlalchemy import create_engine
-    from sqlalchemy.orm import sessionmaker
-
     from app.models.enums import PlanTaskStatus as ModelPlanTaskStatus
     from app.models.enums import ProcessingStatus
     from app.models.plan import Plan as PlanModel
@@ -188,9 +190,7 @@ async def run_task_spawning(
     project_uuid = UUID(project_id)
 
     logger.debug(f"Creating database session for task spawning job {plan_id}")
-    engine = create_engine(settings.database_url)
-    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
-    db = SessionLocal()
+    db = ctx["session_factory"]()
 
     try:
         plan = db.query(PlanModel).filter(PlanModel.id == plan_uuid).first()
@@ -214,6 +214,9 @@ async def run_task_spawning(
         subscription_token, token_id = token_result
         logger.info(f"Using subscription token {token_id} for task spawning {plan_id}")
 
+        # Release the connection while waiting on Claude (see run_plan_generation)
+        db.commit()
+
         try:
             result = await claude_service.generate_tasks(
                 plan_id=plan_uuid,
@@ -225,18 +228,20 @@ async def run_task_spawning(
 
             logger.info(f"Claude returned {len(result.tasks)} tasks for plan_id={plan_id}")
 
+            # Tasks stay pending until commit so the single flush batches
+            # their INSERTs (ids come from the client-side uuid4 default)
             created_tasks: list[TaskModel] = []
             for i, generated_task in enumerate(result.tasks):
                 logger.debug(f"Creating task {i+1}/{len(result.tasks)}: '{generated_task.title}'")
-                new_task = TaskModel(
-                    project_id=project_uuid,
-                    plan_id=plan_uuid,
-                    title=generated_task.title,
-                    description=generated_task.description,
+                created_tasks.append(
+                    TaskModel(
+                        project_id=project_uuid,
+                        plan_id=plan_uuid,
+                        title=generated_task.title,
+                        description=generated_task.description,
+                    )
                 )
-                db.add(new_task)
-                db.flush()
-                created_tasks.append(new_task)
+            db.add_all(created_tasks)
 
             # Set up blocking relationships
             logger.debug(f"Setting up blocking relationships for {len(created_tasks)} tasks")
@@ -266,6 +271,8 @@ async def run_task_spawning(
                 "success": True,
                 "plan_id": plan_id,
                 "tasks_created": len(created_tasks),
+                "total_cost_usd": result.total_cost_usd,
+                "duration_ms": result.duration_ms,
             }
 
         except (ClaudeNotConfiguredError, ClaudeGenerationError) as e:
@@ -298,7 +305,6 @@ async def run_task_spawning(
 
     finally:
         db.close()
-        engine.dispose()
 
 
 # ============================================================================
@@ -443,13 +449,25 @@ async def get_queue_info() -> dict[str, Any]:
 
 async def startup(ctx: dict[str, Any]) -> None:
     """Worker startup hook."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
     ctx["worker_id"] = str(uuid4())[:8]
+
+    # One engine per worker so jobs reuse pooled connections instead of
+    # reconnecting every time; pre-ping drops connections that went stale
+    # between jobs.
+    ctx["db_engine"] = create_engine(settings.database_url, pool_pre_ping=True)
+    ctx["session_factory"] = sessionmaker(bind=ctx["db_engine"], autocommit=False, autoflush=False)
     logger.info(f"ARQ worker starting up with id={ctx['worker_id']}")
 
 
 async def shutdown(ctx: dict[str, Any]) -> None:
     """Worker shutdown hook."""
     logger.info(f"ARQ worker shutting down with id={ctx.get('worker_id')}")
+    engine = ctx.pop("db_engine", None)
+    if engine is not None:
+        engine.dispose()
 
 
 async def on_job_start(ctx: dict[str, Any]) -> None:
@@ -0,0 +1,340 @@
+"""Tests for the Claude generation service helpers."""
+
+import asyncio
+import logging
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from app.services import claude
+from app.services.claude import (
+    ClaudeGenerationError,
+    ClaudeNotConfiguredError,
+    GenerationResult,
+    TaskGenerationResult,
+    _coalesce,
+    _GenerationCache,
+    _parse_tasks_from_response,
+    _plan_cache,
+    _sdk_slot,
+    generate_plan_content,
+    generate_tasks_from_plan,
+    stream_plan_content,
+)
+
+
+class TestGenerationCache:
+    def test_key_depends_on_every_part(self):
+        assert _GenerationCache.make_key("plan", "a", "b") != _GenerationCache.make_key(
+            "plan", "a", "c"
+        )
+        assert _GenerationCache.make_key("plan", "ab", None) != _GenerationCache.make_key(
+            "plan", "a", "b"
+        )
+
+    def test_get_returns_stored_value(self):
+        cache: _GenerationCache[str] = _GenerationCache(ttl_seconds=60, max_entries=4)
+        cache.set("k", "value")
+        assert cache.get("k") == "value"
+        assert cache.get("missing") is None
+
+    def test_expired_entries_are_dropped(self):
+        cache: _GenerationCache[str] = _GenerationCache(ttl_seconds=-1, max_entries=4)
+        cache.set("k", "value")
+        assert cache.get("k") is None
+
+    def test_evicts_least_recently_used(self):
+        cache: _GenerationCache[str] = _GenerationCache(ttl_seconds=60, max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+        assert cache.get("c") == "3"
+
+
+class TestGeneratePlanContentCache:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        _plan_cache.clear()
+        yield
+        _plan_cache.clear()
+
+    async def test_cache_hit_skips_claude(self):
+        plan_id = uuid4()
+        cached = GenerationResult(content="cached plan")
+        _plan_cache.set(
+            _GenerationCache.make_key("plan", str(plan_id), "Title", None, "Project: X"), cached
+        )
+
+        result = await generate_plan_content(
+            plan_id=plan_id,
+            title="Title",
+            project_context="Project: X",
+            subscription_token="token",
+            use_cache=True,
+        )
+
+        assert result is cached
+
+    async def test_other_plans_do_not_share_results(self):
+        fresh = GenerationResult(content="fresh plan")
+        _plan_cache.set(
+            _GenerationCache.make_key("plan", str(uuid4()), "Title", None, None),
+            GenerationResult(content="other plan"),
+        )
+
+        with patch("app.services.claude._generate_plan", return_value=fresh) as generate:
+            result = await generate_plan_content(
+                plan_id=uuid4(), title="Title", subscription_token="token", use_cache=True
+            )
+
+        assert result is fresh
+        generate.assert_awaited_once()
+
+    async def test_explicit_generation_skips_cached_result_and_stores_new_one(self):
+        plan_id = uuid4()
+        fresh = GenerationResult(content="fresh plan")
+        key = _GenerationCache.make_key("plan", str(plan_id), "Title", None, None)
+        _plan_cache.set(key, GenerationResult(content="cached plan"))
+
+        with patch("app.services.claude._generate_plan", return_value=fresh) as generate:
+            result = await generate_plan_content(
+                plan_id=plan_id, title="Title", subscription_token="token"
+            )
+
+        assert result is fresh
+        generate.assert_awaited_once()
+        assert _plan_cache.get(key) is fresh
+
+    async def test_concurrent_task_generations_share_one_call(self):
+        async def fake_generate(*args) -> TaskGenerationResult:
+            await asyncio.sleep(0.01)
+            return TaskGenerationResult(tasks=[])
+
+        with patch("app.services.claude._generate_tasks", side_effect=fake_generate) as generate:
+            results = await asyncio.gather(
+                *(
+                    generate_tasks_from_plan(
+                        plan_id=uuid4(),
+                        title="Title",
+                        content="Plan",
+                        subscription_token="token",
+                    )
+                    for _ in range(2)
+                )
+            )
+
+        assert results[0] is results[1]
+        generate.assert_awaited_once()
+
+
+class TestStreamPlanContent:
+    async def test_yields_text_blocks_in_order(self):
+        from claude_agent_sdk import AssistantMessage, TextBlock
+
+        async def fake_query(prompt, options):
+            yield AssistantMessage(content=[TextBlock(text="# Plan")], model="m")
+            yield AssistantMessage(content=[TextBlock(text="Step 1")], model="m")
+
+        with patch("claude_agent_sdk.query", fake_query):
+            chunks = [
+                chunk
+                async for chunk in stream_plan_content(
+                    plan_id=uuid4(), title="Title", subscription_token="token"
+                )
+            ]
+
+        assert chunks == ["# Plan", "Step 1"]
+
+    async def test_reports_cost_and_duration(self):
+        from claude_agent_sdk import AssistantMessage, ResultMessage, TextBlock
+
+        async def fake_query(prompt, options):
+            yield AssistantMessage(content=[TextBlock(text="# Plan")], model="m")
+            yield ResultMessage(
+                subtype="success",
+                duration_ms=1200,
+                duration_api_ms=1000,
+                is_error=False,
+                num_turns=1,
+                session_id="s",
+                total_cost_usd=0.25,
+            )
+
+        reported = []
+        with patch("claude_agent_sdk.query", fake_query):
+            async for _ in stream_plan_content(
+                plan_id=uuid4(),
+                title="Title",
+                subscription_token="token",
+                on_result=lambda cost, duration: reported.append((cost, duration)),
+            ):
+                pass
+
+        assert reported == [(0.25, 1200)]
+
+    async def test_logs_prompt_cache_usage(self, caplog):
+        from claude_agent_sdk import ResultMessage
+
+        async def fake_query(prompt, options):
+            yield ResultMessage(
+                subtype="success",
+                duration_ms=1200,
+                duration_api_ms=1000,
+                is_error=False,
+                num_turns=1,
+                session_id="s",
+                usage={"input_tokens": 10, "cache_read_input_tokens": 300},
+            )
+
+        with caplog.at_level("INFO", logger="app.services.claude"):
+            with patch("claude_agent_sdk.query", fake_query):
+                async for _ in stream_plan_content(
+                    plan_id=uuid4(), title="Title", subscription_token="token"
+                ):
+                    pass
+
+        assert "cache_read_input_tokens=300" in caplog.text
+
+    async def test_missing_sdk_raises_not_configured(self):
+        with patch.multiple("app.services.claude", _sdk=None, _sdk_error=ImportError("no sdk")):
+            with pytest.raises(ClaudeNotConfiguredError):
+                async for _ in stream_plan_content(
+                    plan_id=uuid4(), title="Title", subscription_token="token"
+                ):
+                    pass
+
+
+class TestCoalesce:
+    async def test_concurrent_calls_share_one_run(self):
+        calls = 0
+
+        async def run() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*(_coalesce("key", run) for _ in range(3)))
+
+        assert results == ["result", "result", "result"]
+        assert calls == 1
+
+    async def test_failure_propagates_to_waiters(self):
+        async def run() -> str:
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            _coalesce("fail", run), _coalesce("fail", run), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+    async def test_owner_cancellation_does_not_cancel_waiters(self):
+        calls = 0
+
+        async def run() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        owner = asyncio.create_task(_coalesce("cancel", run))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(_coalesce("cancel", run))
+        await asyncio.sleep(0)
+        owner.cancel()
+
+        assert await waiter == "result"
+        assert owner.cancelled()
+        assert calls == 2
+
+    async def test_key_is_released_after_completion(self):
+        async def run() -> int:
+            return 1
+
+        await _coalesce("again", run)
+
+        calls = []
+
+        async def second() -> int:
+            calls.append(1)
+            return 2
+
+        assert await _coalesce("again", second) == 2
+        assert calls == [1]
+
+
+class TestParseTasksFromResponse:
+    @pytest.mark.parametrize(
+        "response",
+        [
+            '{"tasks": [{"title": "A", "description": "a"}]}',
+            'Here you go:\n```json\n{"tasks": [{"title": "A", "description": "a"}]}\n```',
+            '```\n{"tasks": [{"title": "A", "description": "a"}]}\n```\nDone.',
+        ],
+    )
+    def test_extracts_json_with_or_without_fence(self, response):
+        tasks = _parse_tasks_from_response(response)
+
+        assert [(t.title, t.description) for t in tasks] == [("A", "a")]
+
+    def test_invalid_json_raises(self):
+        with pytest.raises(ClaudeGenerationError, match="Failed to parse tasks JSON"):
+            _parse_tasks_from_response("```json\nnot json\n```")
+
+    @pytest.mark.parametrize(
+        ("response", "message"),
+        [
+            ('{"items": []}', "missing 'tasks' key"),
+            ('[1, 2]', "missing 'tasks' key"),
+            ('{"tasks": {}}', "'tasks' must be a list"),
+            ('{"tasks": ["A"]}', "index 0: must be an object"),
+            (
+                '{"tasks": [{"title": "A", "description": "a"},'
+                ' {"title": "", "description": "b"}]}',
+                "index 1: missing or invalid 'title'",
+            ),
+            (
+                '{"tasks": [{"title": "A", "description": 3}]}',
+                "index 0: missing or invalid 'description'",
+            ),
+        ],
+    )
+    def test_invalid_shape_raises(self, response, message):
+        with pytest.raises(ClaudeGenerationError, match=message):
+            _parse_tasks_from_response(response)
+
+    def test_drops_invalid_dependency_indices(self, caplog):
+        tasks = _parse_tasks_from_response(
+            '{"tasks": ['
+            '{"title": "A", "description": "a", "blocked_by_indices": "0"},'
+            '{"title": "B", "description": "b", "blocked_by_indices": [0, 1, -1, "0"]},'
+            '{"title": "C", "description": "c", "blocked_by_indices": [1, 0, 5, true]}'
+            "]}"
+        )
+
+        assert [t.blocked_by_indices for t in tasks] == [[], [0], [1, 0]]
+        warnings = [r.getMessage() for r in caplog.records if r.levelname == "WARNING"]
+        assert len(warnings) == 6
+        assert "Task 1 ('B') has invalid blocked_by index 1, skipping" in warnings
+        assert "Task 2 ('C') has invalid blocked_by index True, skipping" in warnings
+
+
+class TestSdkSlot:
+    async def test_waiters_queue_beyond_limit(self, caplog):
+        caplog.set_level(logging.INFO, logger="app.services.claude")
+        with patch("app.services.claude._sdk_semaphore", asyncio.Semaphore(1)):
+            async with _sdk_slot():
+                waiter = asyncio.create_task(_sdk_slot().__aenter__())
+                await asyncio.sleep(0)
+                assert claude._sdk_waiting == 1
+                assert not waiter.done()
+
+            await waiter
+            assert claude._sdk_waiting == 0
+        assert "All Claude SDK slots busy; 1 generation(s) waiting" in caplog.messages
@@ -10,16 +10,17 @@ from app.schemas.task import FileStatus
 from app.services.git import (
     GitError,
     GitService,
-    _extract_file_patch,
     _generate_branch_name,
-    _parse_diff_stat_line,
-    _parse_name_status,
+    _parse_diff_records,
     _slugify,
+    branch_exists,
     generate_diff,
     get_current_branch,
+    iter_file_diffs,
     parse_hunk_header,
     parse_patch_lines,
     validate_comment_line_number,
+    worktree_exists_at_path,
 )
 
 # =============================================================================
@@ -27,119 +28,6 @@ from app.services.git import (
 # =============================================================================
 
 
-class TestParseDiffStatLine:
-    def test_parse_basic_line(self):
-        result = _parse_diff_stat_line("10\t5\tpath/to/file.py")
-        assert result is not None
-        path, status, additions, deletions = result
-        assert path == "path/to/file.py"
-        assert additions == 10
-        assert deletions == 5
-
-    def test_parse_only_additions(self):
-        result = _parse_diff_stat_line("10\t0\tnew_file.py")
-        assert result is not None
-        path, status, additions, deletions = result
-        assert path == "new_file.py"
-        assert status == FileStatus.ADDED
-        assert additions == 10
-        assert deletions == 0
-
-    def test_parse_only_deletions(self):
-        result = _parse_diff_stat_line("0\t10\tdeleted_file.py")
-        assert result is not None
-        path, status, additions, deletions = result
-        assert path == "deleted_file.py"
-        assert status == FileStatus.DELETED
-        assert additions == 0
-        assert deletions == 10
-
-    def test_parse_binary_file(self):
-        result = _parse_diff_stat_line("-\t-\tbinary.png")
-        assert result is not None
-        path, status, additions, deletions = result
-        assert path == "binary.png"
-        assert additions == 0
-        assert deletions == 0
-
-    def test_parse_invalid_line(self):
-        result = _parse_diff_stat_line("invalid line format")
-        assert result is None
-
-
-class TestParseNameStatus:
-    def test_parse_added_file(self):
-        output = "A\tnew_file.py"
-        result = _parse_name_status(output)
-        assert result["new_file.py"] == FileStatus.ADDED
-
-    def test_parse_modified_file(self):
-        output = "M\tmodified_file.py"
-        result = _parse_name_status(output)
-        assert result["modified_file.py"] == FileStatus.MODIFIED
-
-    def test_parse_deleted_file(self):
-        output = "D\tdeleted_file.py"
-        result = _parse_name_status(output)
-        assert result["deleted_file.py"] == FileStatus.DELETED
-
-    def test_parse_renamed_file(self):
-        output = "R100\told_name.py\tnew_name.py"
-        result = _parse_name_status(output)
-        assert result["new_name.py"] == FileStatus.RENAMED
-
-    def test_parse_multiple_files(self):
-        output = "A\tnew_file.py\nM\tmodified.py\nD\tdeleted.py"
-        result = _parse_name_status(output)
-        assert len(result) == 3
-        assert result["new_file.py"] == FileStatus.ADDED
-        assert result["modified.py"] == FileStatus.MODIFIED
-        assert result["deleted.py"] == FileStatus.DELETED
-
-
-class TestExtractFilePatch:
-    def test_extract_single_file(self):
-        full_diff = """diff --git a/file.py b/file.py
-index abc123..def456 100644
---- a/file.py
-+++ b/file.py
-@@ -1,3 +1,4 @@
- line1
-+added line
- line2
- line3"""
-        result = _extract_file_patch(full_diff, "file.py")
-        assert "diff --git" in result
-        assert "+added line" in result
-
-    def test_extract_from_multiple_files(self):
-        full_diff = """diff --git a/first.py b/first.py
---- a/first.py
-+++ b/first.py
-@@ -1 +1,2 @@
- first
-+new
-diff --git a/second.py b/second.py
---- a/second.py
-+++ b/second.py
-@@ -1 +1,2 @@
- second
-+another"""
-        result = _extract_file_patch(full_diff, "first.py")
-        assert "first" in result
-        assert "second" not in result
-
-    def test_extract_nonexistent_file(self):
-        full_diff = """diff --git a/file.py b/file.py
---- a/file.py
-+++ b/file.py
-@@ -1 +1 @@
--old
-+new"""
-        result = _extract_file_patch(full_diff, "nonexistent.py")
-        assert result == ""
-
-
 class TestParseHunkHeader:
     def test_parse_basic_header(self):
         result = parse_hunk_header("@@ -10,5 +12,7 @@")
@@ -258,6 +146,32 @@ class TestValidateCommentLineNumber:
         assert validate_comment_line_number(patch, 100, "old") is False
 
 
+class TestParseDiffRecords:
+    """Tests for pairing raw and numstat records from git diff -z."""
+
+    def test_pairs_raw_and_numstat_records(self):
+        records = [
+            ":100644 100644 abc def M",
+            "a.txt",
+            ":100644 100644 abc def R100",
+            "old.txt",
+            "new.txt",
+            "3\t1\ta.txt",
+            "0\t0\t",
+            "old.txt",
+            "new.txt",
+        ]
+        assert _parse_diff_records("\0".join(records)) == [
+            (FileStatus.MODIFIED, "a.txt", 3, 1),
+            (FileStatus.RENAMED, "new.txt", 0, 0),
+        ]
+
+    def test_mismatched_paths_raise(self):
+        records = "\0".join([":100644 100644 abc def M", "a.txt", "3\t1\tb.txt"])
+        with pytest.raises(GitError, match="disagree"):
+            _parse_diff_records(records)
+
+
 class TestGitOperationsIntegration:
     """Integration tests that use GitPython."""
 
@@ -346,6 +260,156 @@ class TestGitOperationsIntegration:
         with pytest.raises(GitError):
             generate_diff(git_repo, "nonexistent-branch")
 
+    def test_iter_file_diffs_raises_before_iteration(self, git_repo: Path):
+        """Git failures surface on the call, not partway through iteration."""
+        with pytest.raises(GitError):
+            iter_file_diffs(git_repo, "nonexistent-branch")
+
+    def test_iter_file_diffs_yields_files(self, git_repo: Path):
+        """Test that the lazy producer yields the same files as generate_diff."""
+        repo = Repo(git_repo)
+        base_branch = get_current_branch(git_repo)
+
+        repo.create_head("iter-branch")
+        repo.heads["iter-branch"].checkout()
+        (git_repo / "new_file.txt").write_text("new file\n")
+        repo.index.add(["new_file.txt"])
+        repo.index.commit("add file")
+
+        files = list(iter_file_diffs(git_repo, base_branch, "iter-branch"))
+        assert [f.path for f in files] == ["new_file.txt"]
+        assert files[0].status == FileStatus.ADDED
+        assert files[0].additions == 1
+
+    def test_iter_file_diffs_replaces_invalid_utf8(self, git_repo: Path):
+        """Non-UTF-8 patch bytes are replaced rather than breaking JSON output."""
+        repo = Repo(git_repo)
+        base_branch = get_current_branch(git_repo)
+
+        repo.create_head("latin1-branch")
+        repo.heads["latin1-branch"].checkout()
+        (git_repo / "latin1.txt").write_bytes(b"caf\xe9\n")
+        repo.index.add(["latin1.txt"])
+        repo.index.commit("add latin-1 file")
+
+        files = list(iter_file_diffs(git_repo, base_branch, "latin1-branch"))
+        assert "+caf\ufffd" in files[0].patch
+
+    def test_iter_file_diffs_renamed_file(self, git_repo: Path):
+        """Test that renames report the new path, status and patch."""
+        repo = Repo(git_repo)
+        base_branch = get_current_branch(git_repo)
+        (git_repo / "old name.txt").write_text("one\ntwo\nthree\nfour\n")
+        repo.index.add(["old name.txt"])
+        repo.index.commit("add file")
+
+        repo.create_head("rename-branch")
+        repo.heads["rename-branch"].checkout()
+        repo.git.mv("old name.txt", "new name.txt")
+        (git_repo / "other.txt").write_text("x\n")
+        repo.index.add(["other.txt"])
+        repo.index.commit("rename file")
+
+        files = list(iter_file_diffs(git_repo, base_branch, "rename-branch"))
+        assert [(f.path, f.status) for f in files] == [
+            ("new name.txt", FileStatus.RENAMED),
+            ("other.txt", FileStatus.ADDED),
+        ]
+        assert "rename to new name.txt" in files[0].patch
+        assert "+x" in files[1].patch
+
+    def test_iter_file_diffs_typechange_keeps_later_patches(self, git_repo: Path):
+        """A symlink-to-file change has two patch sections but one record."""
+        repo = Repo(git_repo)
+        base_branch = get_current_branch(git_repo)
+        (git_repo / "lnk").symlink_to("target")
+        (git_repo / "mode.sh").write_text("echo hi\n")
+        (git_repo / "new\nline").write_text("a\n")
+        (git_repo / "old.txt").write_text("1\n2\n3\n4\n5\n")
+        repo.git.add("-A")
+        repo.git.commit("-m", "base files")
+
+        repo.git.checkout("-b", "typechange-branch")
+        (git_repo / "lnk").unlink()
+        (git_repo / "lnk").write_text("now a file\n")
+        (git_repo / "mode.sh").write_text("echo bye\n")
+        (git_repo / "new\nline").write_text("a\nb\n")
+        repo.git.mv("old.txt", "renamed.txt")
+        (git_repo / "renamed.txt").write_text("1\n2\n3\n4\n5\n6\n")
+        repo.git.add("-A")
+        repo.git.commit("-m", "typechange and friends")
+
+        files = {f.path: f for f in iter_file_diffs(git_repo, base_branch, "typechange-branch")}
+        assert list(files) == ["lnk", "mode.sh", "new\nline", "renamed.txt"]
+
+        lnk_patch = files["lnk"].patch
+        assert lnk_patch.count("diff --git a/lnk b/lnk") == 2
+        assert "-target" in lnk_patch and "+now a file" in lnk_patch
+        assert "+echo bye" in files["mode.sh"].patch
+        assert "lnk" not in files["mode.sh"].patch
+        assert files["new\nline"].patch.endswith("+b")
+        assert "rename to renamed.txt" in files["renamed.txt"].patch
+        assert files["renamed.txt"].patch.endswith("+6")
+
+    def test_iter_file_diffs_ignores_diff_prefix_config(self, git_repo: Path):
+        """Patches still pair with their files when diff.noprefix is set."""
+        repo = Repo(git_repo)
+        base_branch = get_current_branch(git_repo)
+        repo.config_writer().set_value("diff", "noprefix", "true").release()
+
+        repo.git.checkout("-b", "noprefix-branch")
+        (git_repo / "file.txt").write_text("changed content\n")
+        repo.git.commit("-am", "change file")
+
+        files = list(iter_file_diffs(git_repo, base_branch, "noprefix-branch"))
+        assert files[0].path == "file.txt"
+        assert files[0].patch.startswith("diff --git a/file.txt b/file.txt")
+
+    def test_iter_file_diffs_rename_between_changed_files(self, git_repo: Path):
+        """Each file keeps its own patch around a rename."""
+        repo = Repo(git_repo)
+        base_branch = get_current_branch(git_repo)
+        for name in ("a.txt", "b.txt", "c.txt"):
+            (git_repo / name).write_text(f"{name} one\ntwo\nthree\nfour\n")
+        repo.git.add("-A")
+        repo.git.commit("-m", "base files")
+
+        repo.git.checkout("-b", "rename-middle")
+        (git_repo / "a.txt").write_text("a.txt changed\ntwo\nthree\nfour\n")
+        repo.git.mv("b.txt", "b2.txt")
+        (git_repo / "c.txt").write_text("c.txt changed\ntwo\nthree\nfour\n")
+        repo.git.add("-A")
+        repo.git.commit("-m", "rename in the middle")
+
+        files = list(iter_file_diffs(git_repo, base_branch, "rename-middle"))
+        assert [(f.path, f.status) for f in files] == [
+            ("a.txt", FileStatus.MODIFIED),
+            ("b2.txt", FileStatus.RENAMED),
+            ("c.txt", FileStatus.MODIFIED),
+        ]
+        assert "+a.txt changed" in files[0].patch
+        assert "rename from b.txt" in files[1].patch and "@@" not in files[1].patch
+        assert "+c.txt changed" in files[2].patch
+
+    def test_branch_exists_checks_local_heads(self, git_repo: Path):
+        repo = Repo(git_repo)
+        repo.create_head("feature/x")
+        repo.create_tag("v1")
+
+        assert branch_exists(repo, "feature/x")
+        assert branch_exists(repo, get_current_branch(git_repo))
+        assert not branch_exists(repo, "v1")
+        assert not branch_exists(repo, "missing")
+
+    def test_worktree_exists_at_path(self, git_repo: Path, tmp_path: Path):
+        repo = Repo(git_repo)
+        worktree_path = tmp_path / "worktrees" / "wt"
+        repo.git.worktree("add", "--detach", str(worktree_path))
+
+        assert worktree_exists_at_path(repo, worktree_path)
+        assert not worktree_exists_at_path(repo, tmp_path / "worktrees" / "other")
+        assert not worktree_exists_at_path(repo, git_repo)
+
 
 # =============================================================================
 # Worktree Management Tests
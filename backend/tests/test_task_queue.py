@@ -217,3 +217,24 @@ class TestWorkerSettings:
 
         assert WorkerSettings.on_startup is not None
         assert WorkerSettings.on_shutdown is not None
+
+
+class TestWorkerLifecycle:
+    """Tests for the worker startup/shutdown hooks."""
+
+    @pytest.mark.asyncio
+    async def test_startup_creates_shared_session_factory(self):
+        """Test that startup builds one engine for all jobs and shutdown disposes it."""
+        from app.services.task_queue import shutdown, startup
+
+        ctx: dict = {}
+        await startup(ctx)
+
+        engine = ctx["db_engine"]
+        assert ctx["session_factory"].kw["bind"] is engine
+
+        with patch.object(engine, "dispose") as dispose:
+            await shutdown(ctx)
+
+        dispose.assert_called_once()
+        assert "db_engine" not in ctx
@@ -27,7 +27,7 @@ interface FileDiffViewProps {
 
 // Props for line number display
 interface LineNumberProps {
-  lineNumber: number | null;
+  lineNumber?: number | null;
   type: "old" | "new";
 }
 
@@ -8,8 +8,8 @@ export type DiffLineType = "add" | "delete" | "context";
 export interface DiffLine {
   type: DiffLineType;
   content: string;
-  old_line_number: number | null;
-  new_line_number: number | null;
+  old_line_number?: number | null;
+  new_line_number?: number | null;
 }
 
 // Single file diff
@@ -19,7 +19,7 @@ export interface FileDiff {
   additions: number;
   deletions: number;
   patch: string;
-  lines: DiffLine[] | null;
+  lines?: DiffLine[] | null;
 }
 
 // Complete code diff response